@@ -1,5 +1,7 @@
 from enum import Enum
 
+MAX_QUANTITY = 99999.999    # Quantity field: 5 digits, 3 decimals
+
 
 class PayMode(Enum):
     CASH = 0,
@@ -21,6 +23,53 @@ class Product:
     def total(self):
         return round(self.quantity * self.price, 2)
 
+    def to_dict(self):
+        return {'name': self.name, 'quantity': self.quantity, 'price': self.price,
+                'unit': self.unit, 'tax_cd': self.tax_cd}
+
+
+def cents(products):
+    return sum(int(round(p.total() * 100)) for p in products)
+
+
+def coalesce(products, max_quantity=MAX_QUANTITY, max_lines=None):
+    # Merges lines with the same name, price, tax code and unit, keeping the order of first
+    # occurrence. Quantities are summed in thousandths, so the result keeps 3 decimals exactly.
+    # Lines are rounded one by one, so a group whose merged total differs from the sum of its
+    # lines (fractional quantities) is printed as it was, the receipt total never changes.
+    groups = {}
+    order = []
+    for p in products:
+        if p.quantity <= 0:
+            order.append(p)     # no quantity or return line, print as is
+            continue
+        key = (p.name, p.price, p.tax_cd, p.unit)
+        if key not in groups:
+            groups[key] = []
+            order.append(key)
+        groups[key].append(p)
+
+    limit = int(round(max_quantity * 1000))
+    lines = []
+    for item in order:
+        if isinstance(item, Product):
+            lines.append(item)
+            continue
+        name, price, tax_cd, unit = item
+        quantity = sum(int(round(p.quantity * 1000)) for p in groups[item])
+        merged = []
+        while quantity > 0:     # split what does not fit to the quantity field
+            q = min(quantity, limit)
+            merged.append(Product(name, q / 1000, price, unit, tax_cd))
+            quantity -= q
+        if cents(merged) != cents(groups[item]):
+            merged = groups[item]
+        lines.extend(merged)
+
+    if max_lines is not None and len(lines) > max_lines:
+        raise Exception('Too many sale lines: {0:d} > {1:d}'.format(len(lines), max_lines))
+    return lines
+
 
 class FiscalBon:
 
@@ -49,6 +98,27 @@ class FiscalBon:
         self.products.append(product)
         self.total += product.total()
 
+    def coalesce(self, max_quantity=MAX_QUANTITY, max_lines=None):
+        self.products = coalesce(self.products, max_quantity, max_lines)
+        self.total = sum(p.total() for p in self.products)
+
+    def to_dict(self):
+        return {'operator': self.operator, 'password': self.password, 'work_place': self.work_place,
+                'n_sale': self.n_sale, 'storno_reason': self.storno_reason, 'storno_doc': self.storno_doc,
+                'storno_dt': self.storno_dt, 'fm_number': self.fm_number,
+                'products': [p.to_dict() for p in self.products],
+                'pay_mode': self.pay_mode.name, 'payed': self.payed}
+
+    @classmethod
+    def from_dict(cls, d):
+        bon = cls(d['operator'], d['password'], d['work_place'], d['n_sale'], d['storno_reason'],
+                  d['storno_doc'], d['storno_dt'], d['fm_number'])
+        for p in d['products']:
+            bon.add(Product(**p))
+        bon.pay_mode = PayMode[d['pay_mode']]
+        bon.payed = d['payed']
+        return bon
+
     def close(self, amount, pay_mode=PayMode.CASH):
         if amount < self.total:
             raise Exception('Insufficient amount')
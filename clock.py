@@ -0,0 +1,37 @@
+import threading
+import time
+
+
+class SystemClock:
+
+    def monotonic(self):
+        return time.monotonic()
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+
+# Time moves only when somebody sleeps or waits on it: with the loopback connector
+# hours of traffic with print delays, SYN keepalives and timeouts run in seconds.
+class VirtualClock:
+
+    def __init__(self, start=0.0):
+        self.now = start
+        self.lock = threading.Lock()
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.advance(seconds)
+
+    def advance(self, seconds):
+        with self.lock:
+            self.now += max(0.0, seconds)
+
+    def advance_to(self, t):
+        with self.lock:
+            self.now = max(self.now, t)
+
+
+SYSTEM_CLOCK = SystemClock()
@@ -1,5 +1,18 @@
+import importlib
+import os
+import select
 import socket
-import serial
+from urllib.parse import (urlsplit, parse_qsl)
+
+from clock import SYSTEM_CLOCK
+
+# URL scheme -> 'module:attribute' of the connector class, resolved on first use only,
+# so pyserial is not even imported by Ethernet-only processes
+CONNECTORS = {
+    'tcp': 'connector:EthernetConnector',
+    'serial': 'connector:SerialConnector',
+    'pty': 'connector:PtyConnector',
+}
 
 
 class NakException(Exception):
@@ -8,18 +21,28 @@ class NakException(Exception):
 
 class SerialConnector:
 
-    def __init__(self, port, speed):
+    def __init__(self, port, speed, timeout=0.3):
         self.port = port
         self.speed = speed
-        self.com = serial.Serial()
+        self.timeout = timeout
+        self.com = None     # created on connect, pyserial is imported only then
 
     def connect(self):
+        import serial
+        if self.com is None:
+            self.com = serial.Serial()
         self.com.port = self.port
         self.com.baudrate = self.speed
-        self.com.timeout = 0.3  # 300ms red timeout
+        self.com.timeout = self.timeout  # 300ms red timeout by default
         self.com.open()
         return self.com.is_open
 
+    @classmethod
+    def from_url(cls, url, query):
+        # serial:///dev/ttyS0?baud=115200, serial://COM1?baud=9600
+        port = url.path if url.path else url.netloc
+        return cls(port, int(query.pop('baud', 115200)), **query)
+
     def write_data(self, data):
         self.com.write(data)
         self.com.flush()
@@ -28,28 +51,155 @@ class SerialConnector:
         return self.com.read()
 
     def disconnect(self):
-        self.com.close()
+        if self.com is not None:
+            self.com.close()
 
 
 class EthernetConnector:
 
-    def __init__(self, ip, port):
+    def __init__(self, ip, port, timeout=2.0, read_timeout=0.5, keepalive=30, retries=3, backoff=0.2,
+                 clock=SYSTEM_CLOCK):
         self.ip = ip
         self.port = port
+        self.timeout = timeout
+        self.read_timeout = read_timeout
+        self.keepalive = keepalive  # idle seconds before keepalive probes, None to disable
+        self.retries = retries
+        self.backoff = backoff
+        self.clock = clock
         self.address = (self.ip, self.port)
-        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock = None
+        self.buffer = None  # receive buffer, allocated on first connect and reused
+        self.view = None
 
     def connect(self):
-        self.sock.settimeout(2.0)  # 2sec connection timeout
-        self.sock.connect(self.address)
+        if self.buffer is None:
+            self.buffer = bytearray(1024)
+            self.view = memoryview(self.buffer)
+        sock = socket.create_connection(self.address, self.timeout)  # 2sec connection timeout by default
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if self.keepalive is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if hasattr(socket, 'TCP_KEEPIDLE'):     # Linux
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, self.keepalive)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, max(1, self.keepalive // 3))
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+            elif hasattr(socket, 'SIO_KEEPALIVE_VALS'):  # Windows
+                sock.ioctl(socket.SIO_KEEPALIVE_VALS, (1, self.keepalive * 1000, 1000))
+        sock.settimeout(self.read_timeout)  # 500ms read timeout by default
+        self.sock = sock
+
+    @classmethod
+    def from_url(cls, url, query):
+        # tcp://192.168.0.36:4999?read_timeout=0.5
+        return cls(url.hostname, url.port or 4999, **query)
+
+    def reconnect(self):
+        self.disconnect()
+        for attempt in range(self.retries + 1):
+            try:
+                self.connect()
+                return
+            except OSError:
+                if attempt == self.retries:
+                    raise
+                self.clock.sleep(self.backoff * 2 ** attempt)
+
+    def is_alive(self):
+        # Idle links dropped by the ECR or a NAT box show up as readable with EOF.
+        # Stale bytes of an earlier answer are discarded, they would be taken for the next one.
+        while select.select([self.sock], [], [], 0)[0]:
+            try:
+                if self.sock.recv_into(self.buffer) == 0:
+                    return False
+            except OSError:
+                return False
+        return True
 
     def write_data(self, data):
+        if self.sock is None or not self.is_alive():
+            self.reconnect()
+        # No retry once sending started, the ECR may have already executed the command
         self.sock.sendall(data)
-        self.sock.settimeout(0.5)  # 500ms read timeout
 
-    def read_data(self) :
-        return self.sock.recv(1024)
-        return response
+    def read_data(self):
+        n = self.sock.recv_into(self.buffer)
+        if n == 0:
+            self.disconnect()
+            raise ConnectionError('Connection closed by ECR')
+        return self.view[:n]
+
+    def disconnect(self):
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+
+
+class PtyConnector:
+    # Pseudo terminal, e.g. a device emulator or a serial port forwarded by socat.
+    # Without a path a new pty pair is created, the other side is at slave_name.
+
+    def __init__(self, path=None, timeout=0.3):
+        self.path = path
+        self.timeout = timeout
+        self.fd = None
+        self.slave = None
+        self.slave_name = None
+
+    def connect(self):
+        import tty
+        if self.path is None:
+            self.fd, self.slave = os.openpty()
+            self.slave_name = os.ttyname(self.slave)
+        else:
+            self.fd = os.open(self.path, os.O_RDWR | os.O_NOCTTY)
+        tty.setraw(self.fd)
+        return True
+
+    @classmethod
+    def from_url(cls, url, query):
+        # pty:///dev/pts/3 or pty:// for a new pair
+        return cls(url.path or None, **query)
+
+    def write_data(self, data):
+        os.write(self.fd, data)
+
+    def read_data(self):
+        if select.select([self.fd], [], [], self.timeout)[0]:
+            return os.read(self.fd, 1024)
+        return b''
 
     def disconnect(self):
-        self.sock.close()
+        for fd in (self.fd, self.slave):
+            if fd is not None:
+                os.close(fd)
+        self.fd = None
+        self.slave = None
+
+
+def register_connector(scheme, connector):
+    # connector: class with from_url(url, query) or 'module:attribute' loaded on first use
+    CONNECTORS[scheme] = connector
+
+
+def connector_class(scheme):
+    connector = CONNECTORS.get(scheme)
+    if connector is None:
+        raise ValueError('Unknown connector: ' + scheme)
+    if isinstance(connector, str):
+        module, attribute = connector.split(':')
+        connector = getattr(importlib.import_module(module), attribute)
+        CONNECTORS[scheme] = connector
+    return connector
+
+
+def from_url(url):
+    # Query values are passed to the connector as keyword arguments, numbers converted
+    parts = urlsplit(url)
+    query = {}
+    for k, v in parse_qsl(parts.query):
+        try:
+            query[k] = float(v) if '.' in v else int(v)
+        except ValueError:
+            query[k] = v
+    return connector_class(parts.scheme).from_url(parts, query)
@@ -0,0 +1,136 @@
+import ipaddress
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from protocol import DatecsProtocol
+from connector import (EthernetConnector, SerialConnector, from_url)
+from ecr import (DatecsFiscalDevice, CMD_GET_DIAGNOSTIC_INFO)
+
+DEFAULT_TCP_PORT = 4999
+DEFAULT_SPEEDS = (115200, 9600)
+
+
+def probe(connector, timeout=1.0):
+    # Returns {'protocol', 'model', 'serial_number'} of the device behind the connector or None.
+    # The connector must be connected. X framing is tried first, a legacy device does not
+    # answer it and costs one response timeout before the OLD framing is tried.
+    for protocol in (DatecsProtocol.X, DatecsProtocol.OLD):
+        fd = DatecsFiscalDevice(connector, protocol, response_timeout=timeout)
+        fd.connected = True
+        data = protocol.SEP if protocol == DatecsProtocol.X else ''
+        fd.last_packet = protocol.format_packet(fd.seq, CMD_GET_DIAGNOSTIC_INFO, bytearray(data, 'ascii'))
+        try:
+            fd.send_last_packet()
+            detected = DatecsProtocol.detect(fd.wait_response(), CMD_GET_DIAGNOSTIC_INFO)
+            if detected is None:
+                continue
+            fd.protocol = detected
+            fd.get_status()
+        except Exception:
+            continue
+        return {'protocol': detected.name, 'model': fd.model, 'serial_number': fd.serial_number}
+    return None
+
+
+def probe_tcp(ip, port=DEFAULT_TCP_PORT, timeout=1.0):
+    connector = EthernetConnector(ip, port, timeout=timeout, read_timeout=timeout)
+    try:
+        connector.connect()  # unreachable hosts fail here, within the connection timeout
+    except OSError:
+        connector.disconnect()
+        return None
+    try:
+        info = probe(connector, timeout)
+    finally:
+        connector.disconnect()
+    if info is not None:
+        info.update({'connector': 'tcp', 'ip': ip, 'port': port,
+                     'url': 'tcp://{0:s}:{1:d}'.format(ip, port)})
+    return info
+
+
+def probe_serial(port, speeds=DEFAULT_SPEEDS, timeout=1.0):
+    for speed in speeds:
+        connector = SerialConnector(port, speed, timeout=min(timeout, 0.3))
+        try:
+            connector.connect()
+        except Exception:
+            return None  # port busy or gone, other speeds won't help
+        try:
+            info = probe(connector, timeout)
+        finally:
+            connector.disconnect()
+        if info is not None:
+            info.update({'connector': 'serial', 'port': port, 'speed': speed,
+                         'url': 'serial://{0:s}?baud={1:d}'.format(port, speed)})
+            return info
+    return None
+
+
+def serial_ports():
+    from serial.tools import list_ports
+    return [p.device for p in list_ports.comports()]
+
+
+def discover(network=None, tcp_port=DEFAULT_TCP_PORT, ports=None, speeds=DEFAULT_SPEEDS,
+             timeout=1.0, workers=64):
+    # network: '192.168.0.0/24' or an iterable of addresses
+    # ports: serial ports to probe, 'auto' for all local ports, None for no serial probing
+    if isinstance(network, str):
+        network = [str(ip) for ip in ipaddress.ip_network(network, strict=False).hosts()]
+    if ports == 'auto':
+        ports = serial_ports()
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(probe_tcp, ip, tcp_port, timeout) for ip in network or []]
+        futures += [pool.submit(probe_serial, port, speeds, timeout) for port in ports or []]
+        return [info for info in (f.result() for f in futures) if info is not None]
+
+
+def save_inventory(path, devices):
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(devices, f, indent=2)
+    os.replace(tmp, path)
+
+
+def load_inventory(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def inventory(path, refresh=False, **kwargs):
+    # Cached inventory, the network is probed only when the file is missing or on refresh
+    if not refresh and os.path.exists(path):
+        return load_inventory(path)
+    devices = discover(**kwargs)
+    save_inventory(path, devices)
+    return devices
+
+
+def open_device(info, **kwargs):
+    if 'url' in info:
+        connector = from_url(info['url'])
+    elif info['connector'] == 'tcp':
+        connector = EthernetConnector(info['ip'], info['port'])
+    else:
+        connector = SerialConnector(info['port'], info['speed'])
+    return DatecsFiscalDevice(connector, DatecsProtocol[info['protocol']], **kwargs)
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Discover Datecs fiscal devices')
+    parser.add_argument('--network', help='IP range to scan, e.g. 192.168.0.0/24')
+    parser.add_argument('--tcp-port', type=int, default=DEFAULT_TCP_PORT)
+    parser.add_argument('--serial', action='store_true', help='probe all local serial ports')
+    parser.add_argument('--timeout', type=float, default=1.0)
+    parser.add_argument('--inventory', default='devices.json')
+    args = parser.parse_args()
+
+    found = discover(args.network, args.tcp_port, 'auto' if args.serial else None, timeout=args.timeout)
+    save_inventory(args.inventory, found)
+    for d in found:
+        print('{0:s} {1:s} SN: {2:s} ({3:s})'.format(d['connector'], d['model'], d['serial_number'], d['protocol']))
@@ -0,0 +1,87 @@
+import threading
+
+
+# Customer display updates that never queue in front of sales. update() only stores the
+# latest text; a background thread sends it when the device has been idle for idle_gap,
+# so intermediate texts of fast scanning are dropped and sales go first. Link errors are
+# retried with backoff; a device refusing the display commands stops the updates for good.
+class CustomerDisplay:
+
+    def __init__(self, fd, idle_gap=0.05, poll=0.01, max_backoff=5.0):
+        self.fd = fd
+        self.idle_gap = idle_gap
+        self.poll = poll
+        self.max_backoff = max_backoff
+        self.error = None       # why the updates stopped
+        self.latest = None      # (upper, lower) waiting to be shown
+        self.shown = [None, None]
+        self.sent = 0
+        self.dropped = 0
+        self.cond = threading.Condition()
+        self.running = True
+        self.thread = threading.Thread(target=self.run, name='CustomerDisplay', daemon=True)
+        self.thread.start()
+
+    def update(self, upper, lower=''):
+        with self.cond:
+            if self.error is not None:
+                return
+            if self.latest is not None:
+                self.dropped += 1
+            self.latest = (upper, lower)
+            self.cond.notify()
+
+    def close(self):
+        with self.cond:
+            self.running = False
+            self.cond.notify()
+        self.thread.join()
+
+    def idle(self):
+        last = self.fd.last_activity
+        return last is None or self.fd.clock.monotonic() - last >= self.idle_gap
+
+    def send(self, line):
+        # One line per lock, a sale waits at most for one display command
+        with self.cond:
+            text = self.latest[line] if self.latest is not None else None
+        if text is None or text == self.shown[line]:
+            return True
+        if not self.fd.connected or not self.idle() or not self.fd.lock.acquire(blocking=False):
+            return False
+        try:
+            self.fd.display_line(text, line == 0)
+            self.shown[line] = text
+        finally:
+            self.fd.lock.release()
+        return True
+
+    def run(self):
+        delay = self.poll
+        while True:
+            with self.cond:
+                while self.running and self.latest is None:
+                    self.cond.wait()
+                if not self.running:
+                    return
+            try:
+                done = self.send(0) and self.send(1)
+            except OSError:
+                with self.cond:
+                    self.cond.wait(delay)   # link down, don't keep the line busy with retries
+                delay = min(delay * 2, self.max_backoff)
+                continue
+            except Exception as e:
+                with self.cond:
+                    self.error = e          # e.g. no display on the device, retrying won't help
+                    self.latest = None
+                continue
+            delay = self.poll
+            if done:
+                with self.cond:
+                    if self.latest is not None and tuple(self.shown) == self.latest:
+                        self.latest = None
+                        self.sent += 1
+                continue
+            with self.cond:
+                self.cond.wait(self.poll)   # device busy
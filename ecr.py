@@ -1,9 +1,13 @@
+import threading
 from datetime import datetime
 
-from protocol import DatecsProtocol
+from bon import (Product, PayMode, coalesce as bon_coalesce)
+from clock import SYSTEM_CLOCK
+from protocol import (DatecsProtocol, EncodedStrings, SEQ_START, SEQ_MAX)
 from errors import DatecsErrors
 from connector import NakException
 from response import FiscalResponse
+from tracing import now
 
 NAK = 0x15
 SYN = 0x16
@@ -12,17 +16,32 @@ TRM = 0x03
 CMD_GET_DATE_TIME = 0x3e        # Read date and time
 CMD_SET_DATE_TIME = 0x3d        # Set date and time
 
+CMD_DISPLAY_CLEAR = 0x21            # Clear the customer display
+CMD_DISPLAY_UPPER = 0x2f            # Show text on the upper line of the customer display
+CMD_DISPLAY_LOWER = 0x23            # Show text on the lower line of the customer display
+
+CMD_OPEN_NONFISCAL_RECEIPT = 0x26   # Open non-fiscal receipt
+CMD_CLOSE_NONFISCAL_RECEIPT = 0x27  # Close non-fiscal receipt
+CMD_NONFISCAL_TEXT = 0x2a           # Printing of free non-fiscal text
+
 CMD_OPEN_FISCAL_RECEIPT = 0x30  # Open fiscal receipt
 CMD_FISCAL_SALE = 0x31          # Registration of sale
 CMD_TOTAL = 0x35                # Payments and calculation of the total sum (TOTAL)
 CMD_FISCAL_CLOSE = 0x38         # Close fiscal receipt
 CMD_FISCAL_CANCEL = 0x3C        # Cancel fiscal receipt
 CMD_LAST_FISCAL_RECORD = 0x56   # Date of the last fiscal record
+CMD_RECEIPT_STATE = 0x4c        # Status of the current fiscal receipt
+CMD_LAST_DOCUMENT = 0x71        # Number of the last printed document
 CMD_CASH_IN_OUT = 0x46          # Cash in and Cash out operations
+CMD_DAILY_TAXATION_INFO = 0x41  # Daily taxation information
+CMD_DAILY_REPORT = 0x45         # Daily financial report (X or Z)
 
+CMD_GET_STATUS = 0x4a           # Reading the status bytes
 CMD_GET_DIAGNOSTIC_INFO = 0x5a  # Diagnostic information
 CMD_PROGRAMMING = 0xff          # Programming (X devices only)
 
+DISPLAY_WIDTH = 20              # Customer display: 2 lines of 20 characters
+
 
 class DatecsError(Exception):
     def __init__(self, function, code, message):
@@ -32,18 +51,37 @@ class DatecsError(Exception):
         super().__init__(function + ': ' + str(code) + ': ' + message)
 
 
+ERROR_LIST = DatecsErrors()
+
+
 class DatecsFiscalDevice:
 
-    def __init__(self, connector, protocol):
+    def __init__(self, connector, protocol, response_timeout=None, parameter_cache=None, tracer=None,
+                 cash_ledger=None, codepage='cp1251', clock=SYSTEM_CLOCK):
         self.connector = connector
         self.protocol = protocol
-        self.error_list = DatecsErrors()
+        self.error_list = ERROR_LIST
         self.model = None
         self.serial_number = None
+        self.seq = SEQ_START
         self.last_packet = None
         self.last_slip = None
         self.last_slip_timestamp = None
         self.connected = False
+        self.response_timeout = response_timeout  # None - wait for the answer forever
+        self.parameter_cache = parameter_cache
+        self.tracer = tracer
+        self.cash_ledger = cash_ledger
+        self.codepage = codepage
+        self.clock = clock
+        self.strings = EncodedStrings(codepage)
+        self.print_width = protocol.PRINT_WIDTH
+        self.receipt = None     # id of the traced receipt
+        self.lock = threading.RLock()
+        self.last_response = None
+        self.last_activity = None
+        self.latency = None     # moving average of the command round trip, seconds
+        self.response_listeners = []
 
     def connect(self):
         self.connector.connect()
@@ -58,14 +96,30 @@ class DatecsFiscalDevice:
     def send_last_packet(self):
         self.connector.write_data(self.last_packet)
 
-    def wait_response(self):
+    def wait_response(self, cmd=None):
         response = bytearray()
         terminated = False
+        deadline = None
+        if self.response_timeout is not None:
+            deadline = self.clock.monotonic() + self.response_timeout
+        tracer = self.tracer
+        waiting = now() if tracer else 0
+        syn = None      # start of the SYN wait while tracing, False when over
         while not terminated:
             rec = self.connector.read_data()
+            if not rec and deadline is not None and self.clock.monotonic() > deadline:
+                raise TimeoutError('No response from ECR')
             for b in rec:
                 if b == SYN:
+                    if tracer and syn is None:
+                        syn = tracer.record('first_byte', waiting, self.receipt, cmd)
                     continue
+                if tracer and syn is not False:
+                    if syn is None:
+                        waiting = tracer.record('first_byte', waiting, self.receipt, cmd)
+                    else:
+                        waiting = tracer.record('syn', syn, self.receipt, cmd)
+                    syn = False
                 if b == NAK:
                     raise NakException
                 if b == TRM:
@@ -73,22 +127,62 @@ class DatecsFiscalDevice:
 
                 response.append(b)
 
+        if tracer:
+            tracer.record('read', waiting, self.receipt, cmd)
         return response
 
     def execute(self, cmd, data=b''):
         if not self.connected:
             raise Exception('Not connected')
 
-        self.last_packet = self.protocol.format_packet(cmd, data)
-
-        self.send_last_packet()  # send cmd
-        try:
-            response_data = self.wait_response()
-        except NakException:  # NAK from ECR
-            self.send_last_packet()  # repeat last cmd (with same seq)
-            response_data = self.wait_response()
-
-        return FiscalResponse(response_data, self.protocol)
+        tracer = self.tracer
+        with self.lock:
+            sent = self.clock.monotonic()
+            start = now() if tracer else 0
+            if self.seq >= SEQ_MAX:
+                self.seq = SEQ_START
+            else:
+                self.seq += 1
+            self.last_packet = self.protocol.format_packet(self.seq, cmd, data)
+            if tracer:
+                start = tracer.record('encode', start, self.receipt, cmd)
+
+            self.send_last_packet()  # send cmd
+            if tracer:
+                tracer.record('write', start, self.receipt, cmd)
+            try:
+                response_data = self.wait_response(cmd)
+            except NakException:  # NAK from ECR
+                self.send_last_packet()  # repeat last cmd (with same seq)
+                response_data = self.wait_response(cmd)
+
+            start = now() if tracer else 0
+            fr = FiscalResponse(response_data, self.protocol, self.codepage)
+            if tracer:
+                tracer.record('decode', start, self.receipt, cmd)
+            self.last_response = fr
+            self.last_activity = self.clock.monotonic()
+            elapsed = self.last_activity - sent
+            self.latency = elapsed if self.latency is None else 0.8 * self.latency + 0.2 * elapsed
+
+        for listener in self.response_listeners:
+            listener(self, fr)
+        return fr
+
+    def encode(self, data):
+        return data.encode(self.codepage, 'replace')
+
+    def read_status(self):
+        # Status bytes come with every answer, the command itself is the cheapest one to ask
+        if self.protocol == DatecsProtocol.X:
+            err_index = 0
+        else:
+            err_index = -1
+        fr = self.execute(CMD_GET_STATUS)
+        if fr.no_errors(err_index, self.error_list):
+            return fr
+        else:
+            raise DatecsError('GET_STATUS', fr.error_code, fr.error_message)
 
     def get_status(self):
         if self.protocol == DatecsProtocol.X:
@@ -98,7 +192,7 @@ class DatecsFiscalDevice:
             err_index = -1
             data = ''
 
-        fr = self.execute(CMD_GET_DIAGNOSTIC_INFO, bytearray(data, 'ascii'))
+        fr = self.execute(CMD_GET_DIAGNOSTIC_INFO, self.encode(data))
 
         if fr.no_errors(err_index, self.error_list):
             if self.protocol == DatecsProtocol.X:
@@ -111,6 +205,47 @@ class DatecsFiscalDevice:
         else:
             raise DatecsError('GET_DIAGNOSTIC_INFO', fr.error_code, fr.error_message)
 
+    def read_parameter(self, name, index=''):
+        # X only: {Name}<SEP>{Index}<SEP>{Value}<SEP>, empty value reads
+        # Answer: {ErrorCode}<SEP>{VarValue}<SEP>
+        cache = self.parameter_cache if self.serial_number is not None else None
+        if cache is not None:
+            value = cache.get(self.serial_number, name, index)
+            if value is not None:
+                return value
+
+        if self.protocol != DatecsProtocol.X:
+            raise DatecsError('PROGRAMMING', -7, self.error_list.get_message(-7))
+
+        data = name + self.protocol.SEP + str(index) + self.protocol.SEP + self.protocol.SEP
+        with self.lock:     # a write can't come between the read and the caching of its value
+            fr = self.execute(CMD_PROGRAMMING, self.encode(data))
+            if fr.no_errors(0, self.error_list):
+                value = fr.values[1]
+                if cache is not None:
+                    cache.put(self.serial_number, name, index, value)
+                return value
+            else:
+                raise DatecsError('PROGRAMMING', fr.error_code, fr.error_message)
+
+    def write_parameter(self, name, value, index=''):
+        if self.protocol != DatecsProtocol.X:
+            raise DatecsError('PROGRAMMING', -7, self.error_list.get_message(-7))
+
+        cache = self.parameter_cache if self.serial_number is not None else None
+        data = name + self.protocol.SEP + str(index) + self.protocol.SEP + str(value) + self.protocol.SEP
+        with self.lock:
+            try:
+                fr = self.execute(CMD_PROGRAMMING, self.encode(data))
+            finally:
+                if cache is not None:
+                    # after the write, also a failed one may have changed the value
+                    cache.invalidate(self.serial_number, name, index)
+        if fr.no_errors(0, self.error_list):
+            return fr.ok
+        else:
+            raise DatecsError('PROGRAMMING', fr.error_code, fr.error_message)
+
     def get_date_time(self):
         fr = self.execute(CMD_GET_DATE_TIME)
         if self.protocol == DatecsProtocol.X:
@@ -135,14 +270,19 @@ class DatecsFiscalDevice:
             data = date_time.strftime('%d-%m-%y %H:%M:%S')
             err_index = -1
 
-        fr = self.execute(CMD_SET_DATE_TIME, bytearray(data, 'ascii'))
+        fr = self.execute(CMD_SET_DATE_TIME, self.encode(data))
 
         if fr.no_errors(err_index, self.error_list):
             return fr.ok
         else:
             raise DatecsError('SET_DATE_TIME', fr.error_code, fr.error_message)
 
-    def get_cash_availability(self):
+    def get_cash_availability(self, refresh=False):
+        # Served from the cash ledger while it is valid, refresh forces the device query
+        ledger = self.cash_ledger
+        if ledger is not None and not refresh and ledger.valid():
+            return ledger.get()
+
         # X:
         #   Data: {Type}<SEP>{Amount}<SEP>  ('0'-cash in, '1'-cash out)
         #   Answer: {ErrorCode}<SEP>{CashSum}<SEP>{CashIn}<SEP>{CashOut}<SEP>
@@ -155,19 +295,57 @@ class DatecsFiscalDevice:
         else:
             data = '0.00'
 
-        fr = self.execute(CMD_CASH_IN_OUT, bytearray(data, 'ascii'))
+        fr = self.execute(CMD_CASH_IN_OUT, self.encode(data))
         if fr.no_errors(0, self.error_list):
             if self.protocol == DatecsProtocol.X:
-                return {'CashSum': float(fr.values[1]),
-                        'ServIn': float(fr.values[2]),
-                        'ServOut': float(fr.values[3])}
+                figures = {'CashSum': float(fr.values[1]),
+                           'ServIn': float(fr.values[2]),
+                           'ServOut': float(fr.values[3])}
             else:
-                return {'CashSum': float(fr.values[1])/100.00,
-                        'ServIn': float(fr.values[2])/100.00,
-                        'ServOut': float(fr.values[3])/100.00}
+                figures = {'CashSum': float(fr.values[1])/100.00,
+                           'ServIn': float(fr.values[2])/100.00,
+                           'ServOut': float(fr.values[3])/100.00}
+            if ledger is not None:
+                ledger.sync(figures)
+            return figures
         else:
             raise DatecsError('CASH_AVAILABILITY', fr.error_code, fr.error_message)
 
+    def get_daily_totals(self):
+        # X:
+        #   Data: {Type}<SEP>  ('0'-turnover on tax groups)
+        #   Answer: {ErrorCode}<SEP>{nRep}<SEP>{SumA}<SEP>...{SumH}<SEP>
+        # OLD:
+        #   Data: [<Type>]
+        #   Answer: Closure,TaxA,TaxB,TaxC,TaxD
+        if self.protocol == DatecsProtocol.X:
+            data = '0' + self.protocol.SEP
+            err_index = 0
+        else:
+            data = ''
+            err_index = -1
+
+        fr = self.execute(CMD_DAILY_TAXATION_INFO, self.encode(data))
+        if fr.no_errors(err_index, self.error_list):
+            sums = fr.values[err_index + 2:]
+            return [float(v) for v in sums if v != '']
+        else:
+            raise DatecsError('DAILY_TAXATION_INFO', fr.error_code, fr.error_message)
+
+    def daily_report(self, zero=True):
+        # X:   {ReportType}<SEP>  ('X' or 'Z')
+        # OLD: [<Option>]  ('0'-Z report, '2'-X report)
+        if self.protocol == DatecsProtocol.X:
+            data = ('Z' if zero else 'X') + self.protocol.SEP
+        else:
+            data = '0' if zero else '2'
+
+        fr = self.execute(CMD_DAILY_REPORT, self.encode(data))
+        if fr.no_errors(0, self.error_list):
+            return fr.ok
+        else:
+            raise DatecsError('DAILY_REPORT', fr.error_code, fr.error_message)
+
     def cash_in_out(self, amount):
         # X:
         #   Data: {Type}<SEP>{Amount}<SEP>  ('0'-cash in, '1'-cash out)
@@ -182,8 +360,10 @@ class DatecsFiscalDevice:
         else:
             data = "{0:.2f}".format(amount)
 
-        fr = self.execute(CMD_CASH_IN_OUT, bytearray(data, 'ascii'))
+        fr = self.execute(CMD_CASH_IN_OUT, self.encode(data))
         if fr.no_errors(0, self.error_list):
+            if self.cash_ledger is not None:
+                self.cash_ledger.cash_in_out(amount)
             return fr.ok
         else:
             raise DatecsError('CASH_IN_OUT', fr.error_code, fr.error_message)
@@ -191,12 +371,13 @@ class DatecsFiscalDevice:
     def open_fiscal_receipt(self, operator, password, work_place, n_sale):
         # Syntax 1: {OpCode}<SEP>{OpPwd}<SEP>{TillNmb}<SEP>{Invoice}<SEP>
         # Syntax 2: {OpCode}<SEP>{OpPwd}<SEP>{NSale}<SEP>{TillNmb}<SEP>{Invoice}<SEP>
-        data = str(operator) + self.protocol.SEP + str(password) + self.protocol.SEP
+        sep = self.strings.get(self.protocol.SEP)
+        data = self.strings.get(str(operator)) + sep + self.strings.get(str(password)) + sep
         if n_sale is not None:
-            data += n_sale + self.protocol.SEP
-        data += str(work_place) + self.protocol.SEP + self.protocol.SEP
+            data += self.encode(n_sale) + sep
+        data += self.strings.get(str(work_place)) + sep + sep
 
-        fr = self.execute(CMD_OPEN_FISCAL_RECEIPT, bytearray(data, 'ascii'))
+        fr = self.execute(CMD_OPEN_FISCAL_RECEIPT, data)
         if fr.no_errors(0, self.error_list):
             return fr.ok
         else:
@@ -206,16 +387,18 @@ class DatecsFiscalDevice:
         # OLD: [<L1>][<LF><L2>]<Tab><TaxCd><[Sign]Price>[*<Qwan>][,Perc|;Abs]
         # X:   {PluName}<SEP>{TaxCd}<SEP>{Price}<SEP>{Quantity}<SEP>
         #      {DiscountType}<SEP>{DiscountValue}<SEP>{Department}<SEP>{Unit}<SEP>
-        data = str(plu_name) + self.protocol.SEP
-        data += str(tax_cd) + self.protocol.SEP
+        data = str(tax_cd) + self.protocol.SEP
         data += "{0:.2f}".format(price) + self.protocol.SEP
         if quantity > 0:
             data += "{0:.3f}".format(quantity)
         data += 3 * self.protocol.SEP
         data += '0' + self.protocol.SEP     # '0' - without department
-        data += unit + self.protocol.SEP
 
-        fr = self.execute(CMD_FISCAL_SALE, bytearray(data, 'ascii'))
+        sep = self.strings.get(self.protocol.SEP)
+        data = self.strings.get(str(plu_name), self.protocol.MAX_NAME) + sep + self.encode(data) + \
+            self.strings.get(unit, self.protocol.MAX_UNIT) + sep
+
+        fr = self.execute(CMD_FISCAL_SALE, data)
         if fr.no_errors(0, self.error_list):
             return fr.ok
         else:
@@ -226,7 +409,7 @@ class DatecsFiscalDevice:
         # X:   {PaidMode}<SEP>{Amount}<SEP>{Type}<SEP>
         data = str(pay_mode) + self.protocol.SEP
         data += "{0:.2f}".format(amount) + 2 * self.protocol.SEP
-        fr = self.execute(CMD_TOTAL, bytearray(data, 'ascii'))
+        fr = self.execute(CMD_TOTAL, self.encode(data))
         if fr.no_errors(0, self.error_list):
             return fr.ok
         else:
@@ -252,6 +435,182 @@ class DatecsFiscalDevice:
         else:
             raise DatecsError('FISCAL_CANCEL', fr.error_code, fr.error_message)
 
+    def read_receipt_state(self):
+        # X:   Answer: {ErrorCode}<SEP>{IsOpen}<SEP>{Number}<SEP>{Items}<SEP>{Amount}<SEP>{Payed}<SEP>
+        # OLD: Answer: Open,Items,Amount,Tender
+        if self.protocol == DatecsProtocol.X:
+            err_index = 0
+        else:
+            err_index = -1
+
+        fr = self.execute(CMD_RECEIPT_STATE)
+        if fr.no_errors(err_index, self.error_list):
+            if self.protocol == DatecsProtocol.X:
+                return {'open': fr.values[1] == '1',
+                        'items': int(fr.values[3]),
+                        'amount': float(fr.values[4]),
+                        'payed': float(fr.values[5] or 0)}
+            else:
+                return {'open': fr.values[0] == '1',
+                        'items': int(fr.values[1]),
+                        'amount': float(fr.values[2])/100.00,
+                        'payed': float(fr.values[3] or 0)/100.00}
+        else:
+            raise DatecsError('RECEIPT_STATE', fr.error_code, fr.error_message)
+
+    def read_last_slip(self):
+        # X:   Answer: {ErrorCode}<SEP>{DocNum}<SEP>
+        # OLD: Answer: DocNum
+        if self.protocol == DatecsProtocol.X:
+            err_index = 0
+        else:
+            err_index = -1
+
+        fr = self.execute(CMD_LAST_DOCUMENT)
+        if fr.no_errors(err_index, self.error_list):
+            return fr.values[err_index + 1]
+        else:
+            raise DatecsError('LAST_DOCUMENT', fr.error_code, fr.error_message)
+
+    def recover(self, bon, products=None, last_slip=None, since=None):
+        # Finds out what happened to a receipt broken by a communication error and finishes it.
+        # last_slip: read_last_slip() just before the receipt was opened.
+        # since: datetime before the receipt was started, the last fiscal record must not be older.
+        # Returns 'printed', 'not_printed', 'closed', 'paid', 'resumed' or 'cancelled'.
+        if products is None:
+            products = bon.products
+
+        if not self.read_status().fiscal_receipt_open():
+            slip = self.read_last_slip()
+            if last_slip is None or int(slip) == int(last_slip):
+                return 'not_printed'
+            # The counter moved, but reports or other processes move it too: it is our slip
+            # only when it is the one document since and its record is not older than the receipt
+            self.read_bon_timestamp()
+            record = datetime.strptime(self.last_slip_timestamp[1], '%d-%m-%y %H:%M:%S')
+            if int(slip) != int(last_slip) + 1 or (since is not None and record < since.replace(microsecond=0)):
+                raise Exception('Receipt state unknown: document {0:s} -> {1:s}, last record {2:s}'.format(
+                    str(last_slip), str(slip), str(record)))
+            self.last_slip = slip   # the answer of close was lost, the slip is out
+            return 'printed'
+
+        state = self.read_receipt_state()
+        total = sum(int(round(p.total() * 100)) for p in products) / 100.0
+        if state['payed'] > 0:
+            # Payment started, the receipt can't be cancelled any more
+            if state['payed'] < state['amount']:
+                self.total(bon.pay_mode, round(state['amount'] - state['payed'], 2))
+                self.close_bon()
+                return 'paid'
+            self.close_bon()
+            return 'closed'
+
+        items = state['items']
+        sent = sum(int(round(p.total() * 100)) for p in products[:items]) / 100.0
+        if items > len(products) or abs(sent - state['amount']) >= 0.005:
+            self.cancel_bon()     # the device holds something else than we sent
+            return 'cancelled'
+
+        try:
+            for p in products[items:]:
+                self.fiscal_sale(p.name, p.tax_cd, p.price, p.quantity, p.unit)
+            self.total(bon.pay_mode, bon.payed if bon.payed else total)
+            self.close_bon()
+        except DatecsError:
+            self.cancel_bon()
+            raise
+        return 'resumed'
+
+    def open_nonfiscal_receipt(self):
+        fr = self.execute(CMD_OPEN_NONFISCAL_RECEIPT)
+        if fr.no_errors(0, self.error_list):
+            return fr.ok
+        else:
+            raise DatecsError('OPEN_NONFISCAL_RECEIPT', fr.error_code, fr.error_message)
+
+    def nonfiscal_text(self, text):
+        # OLD: <Text>
+        # X:   {Text}<SEP>{Bold}<SEP>{Italic}<SEP>{Height}<SEP>{Underline}<SEP>{alignment}<SEP>
+        data = text
+        if self.protocol == DatecsProtocol.X:
+            data += 6 * self.protocol.SEP
+
+        fr = self.execute(CMD_NONFISCAL_TEXT, self.encode(data))
+        if fr.no_errors(0, self.error_list):
+            return fr.ok
+        else:
+            raise DatecsError('NONFISCAL_TEXT', fr.error_code, fr.error_message)
+
+    def close_nonfiscal_receipt(self):
+        fr = self.execute(CMD_CLOSE_NONFISCAL_RECEIPT)
+        if fr.no_errors(0, self.error_list):
+            return fr.ok
+        else:
+            raise DatecsError('CLOSE_NONFISCAL_RECEIPT', fr.error_code, fr.error_message)
+
+    def pack_text(self, lines, line_width=None, pack=False):
+        # One text command per printed line, lines longer than line_width (the device print
+        # width by default) are wrapped. pack: joins the lines with LF into as few commands
+        # as the packet data length allows, only for devices that break the printed lines on LF.
+        if line_width is None:
+            line_width = self.print_width
+        limit = self.protocol.MAX_DATA
+        if self.protocol == DatecsProtocol.X:
+            limit -= 6 * len(self.protocol.SEP)
+
+        chunks = []
+        chunk = None
+        for line in lines:
+            line = line.rstrip('\r\n')
+            parts = [line[i:i + line_width] for i in range(0, len(line), line_width)] or ['']
+            for part in parts:
+                if not pack:
+                    chunks.append(part)
+                elif chunk is None:
+                    chunk = part
+                elif len(chunk) + 1 + len(part) > limit:
+                    chunks.append(chunk)
+                    chunk = part
+                else:
+                    chunk += '\n' + part
+        if chunk is not None:
+            chunks.append(chunk)
+        return chunks
+
+    def print_nonfiscal(self, lines, line_width=None, pack=False):
+        self.open_nonfiscal_receipt()
+        try:
+            for chunk in self.pack_text(lines, line_width, pack):
+                self.nonfiscal_text(chunk)
+        except DatecsError:
+            self.close_nonfiscal_receipt()  # not on a link error, it would hide the original one
+            raise
+        return self.close_nonfiscal_receipt()
+
+    def display_clear(self):
+        fr = self.execute(CMD_DISPLAY_CLEAR)
+        if fr.no_errors(0, self.error_list):
+            return fr.ok
+        else:
+            raise DatecsError('DISPLAY_CLEAR', fr.error_code, fr.error_message)
+
+    def display_line(self, text, upper=True):
+        # OLD: <Text>
+        # X:   {Text}<SEP>
+        data = text[:DISPLAY_WIDTH]    # transient texts, kept out of the catalogue strings
+        if self.protocol == DatecsProtocol.X:
+            data += self.protocol.SEP
+
+        fr = self.execute(CMD_DISPLAY_UPPER if upper else CMD_DISPLAY_LOWER, self.encode(data))
+        if fr.no_errors(0, self.error_list):
+            return fr.ok
+        else:
+            raise DatecsError('DISPLAY_TEXT', fr.error_code, fr.error_message)
+
+    def display_text(self, upper, lower=''):
+        self.display_line(upper, True)
+        return self.display_line(lower, False)
+
     def read_bon_timestamp(self):
         fr = self.execute(CMD_LAST_FISCAL_RECORD)
         if fr.no_errors(0, self.error_list):
@@ -260,17 +619,86 @@ class DatecsFiscalDevice:
         else:
             raise DatecsError('LAST_FISCAL_RECORD', fr.error_code, fr.error_message)
 
-    def print(self, bon):
-        if bon.storno_reason is None:
-            self.open_fiscal_receipt(bon.operator, bon.password, bon.work_place, bon.n_sale)
-        else:
-            self.open_storno_document()
+    def print(self, bon, coalesce=False, max_lines=None, recover=False):
+        # recover: after a communication error the receipt is resumed, closed or cancelled
+        # according to the device state instead of always cancelled, see recover()
+        products = bon.products
+        if coalesce:
+            if max_lines is None:
+                max_lines = self.protocol.MAX_LINES
+            products = bon_coalesce(products, max_lines=max_lines)
+        if not recover:
+            self.print_stream(bon, products)
+            return 'printed'
+
+        # Read now: other processes, reports and non-fiscal slips move the counter too
+        last_slip = self.read_last_slip()
+        try:
+            self.print_stream(bon, products, cancel=False)
+            return 'printed'
+        except OSError:
+            if self.cash_ledger is not None:
+                self.cash_ledger.invalidate()   # not sure what got paid, ask the device next time
+            result = self.recover(bon, products, last_slip)
+            if result in ('not_printed', 'cancelled'):
+                self.print_stream(bon, products)
+                return 'printed'
+            return result
+        except Exception:
+            # The status bytes of the last answer tell whether the open got through,
+            # cancelling a receipt that is not open would hide the original error
+            if self.last_response is not None and self.last_response.fiscal_receipt_open():
+                self.cancel_bon()
+            raise
 
+    def print_stream(self, bon, lines, amount=None, cancel=True):
+        # Sends lines as they are produced, bon.products are not used. Lines are Product
+        # objects or rows (name, quantity, price[, unit[, tax_cd]]), e.g. from a database cursor.
+        # Paid amount: amount, else bon.payed, else the exact total. Returns the total.
+        tracer = self.tracer
+        if tracer:
+            self.receipt = tracer.new_receipt()
+        start = now() if tracer else 0
+
+        total = 0   # in cents, float sums drift on long receipts
+        opened = False
         try:
-            for p in bon.products:
+            if bon.storno_reason is None:
+                self.open_fiscal_receipt(bon.operator, bon.password, bon.work_place, bon.n_sale)
+            else:
+                self.open_storno_document()
+            opened = True
+            if tracer:
+                start = tracer.record('open', start, self.receipt)
+            for p in lines:
+                if not isinstance(p, Product):
+                    p = Product(*p)
                 self.fiscal_sale(p.name, p.tax_cd, p.price, p.quantity, p.unit)
-            self.total(bon.pay_mode, bon.payed)
+                total += int(round(p.total() * 100))
+                if tracer:
+                    start = tracer.record('sale', start, self.receipt)
+            if amount is None:
+                amount = bon.payed if bon.payed else total / 100.0
+            self.total(bon.pay_mode, amount)
+            if tracer:
+                start = tracer.record('total', start, self.receipt)
             self.close_bon()
+            if tracer:
+                tracer.record('close', start, self.receipt)
+            if self.cash_ledger is not None and bon.pay_mode == PayMode.CASH:
+                cash = min(amount, total / 100.0)     # the change goes back to the customer
+                self.cash_ledger.sale(cash if bon.storno_reason is None else -cash)
         except Exception:
-            self.cancel_bon()
+            if tracer and not opened:
+                tracer.record('open', start, self.receipt)     # the failed open
+            if cancel and opened:
+                start = now() if tracer else 0
+                self.cancel_bon()
+                if tracer:
+                    tracer.record('cancel', start, self.receipt)
+            if tracer and tracer.dump_path:
+                tracer.dump()
             raise
+        finally:
+            self.receipt = None
+        return total / 100.0
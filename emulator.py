@@ -0,0 +1,268 @@
+import socket
+import threading
+import time
+from datetime import datetime
+
+from protocol import (DatecsProtocol, PREAMBLE, POSTAMBLE, TERMINATOR, SEPARATOR)
+import ecr
+
+NAK = b'\x15'
+SYN = b'\x16'
+SYN_INTERVAL = 0.06     # the ECR sends SYN every 60ms while it is busy
+
+
+# Fake ECR speaking the protocol framing, for load tests and tests without hardware.
+# Keeps just enough state (open receipt, slip number, cash) for DatecsFiscalDevice to work.
+class EcrEmulator:
+
+    def __init__(self, protocol, model='FP-700X', serial_number='DT000000', latency=0.0, codepage='cp1251'):
+        self.protocol = protocol
+        self.codepage = codepage
+        self.model = model
+        self.serial_number = serial_number
+        self.latency = latency      # seconds, or {cmd: seconds} with an optional None default
+        self.status = bytearray(b'\x80' * (8 if protocol == DatecsProtocol.X else 6))
+        self.parameters = {}
+        self.slip = 0
+        self.record = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)  # last fiscal record
+        self.receipt = None         # [items, amount, payed] of the open receipt
+        self.cash = [0.0, 0.0, 0.0]
+        self.taxes = [0.0] * 8
+        self.display = ['', '']
+        self.commands = 0
+        self.last = None            # (seq, answer), a repeated seq gets the answer again
+        self.lock = threading.Lock()
+
+    def delay(self, cmd):
+        if isinstance(self.latency, dict):
+            return self.latency.get(cmd, self.latency.get(None, 0.0))
+        return self.latency
+
+    def parse(self, packet):
+        # Returns (seq, cmd, data) or None for a broken packet
+        if len(packet) < 10 or packet[:1] != PREAMBLE or packet[-1:] != TERMINATOR:
+            return None
+        body = packet[1:-5]
+        if self.protocol.calc_bcc(body) != packet[-5:-1]:
+            return None
+        if self.protocol == DatecsProtocol.X:
+            cmd = 0
+            for b in packet[6:10]:
+                cmd = (cmd << 4) | (b - 0x30)
+            return packet[5], cmd, bytes(packet[10:-6])
+        return packet[2], packet[3], bytes(packet[4:-6])
+
+    def frame(self, seq, cmd, values):
+        sep = self.protocol.SEP
+        if self.protocol == DatecsProtocol.X:
+            data = bytearray(sep.join(values) + sep if values else sep, self.codepage, 'replace')
+            packet = DatecsProtocol.encode_word(0x20 + 19 + len(data)) + bytes([seq]) + \
+                DatecsProtocol.encode_word(cmd)
+        else:
+            data = bytearray(sep.join(values), self.codepage, 'replace')
+            packet = bytearray([0x20 + 11 + len(data), seq, cmd])
+        packet += data + SEPARATOR + self.status + POSTAMBLE
+        return PREAMBLE + packet + self.protocol.calc_bcc(packet) + TERMINATOR
+
+    def handle(self, packet):
+        # Returns (processing delay, answer bytes)
+        parsed = self.parse(packet)
+        if parsed is None:
+            return 0.0, NAK
+        seq, cmd, data = parsed
+        with self.lock:
+            if self.last is not None and self.last[0] == seq:
+                return 0.0, self.last[1]    # like the ECR: not executed again
+            self.commands += 1
+            values = self.answer(cmd, data.decode(self.codepage, 'replace').split(self.protocol.SEP))
+            answer = self.frame(seq, cmd, values)
+            self.last = (seq, answer)
+        return self.delay(cmd), answer
+
+    def answer(self, cmd, args):
+        x = self.protocol == DatecsProtocol.X
+        now = datetime.now()
+        ok = ['0'] if x else []
+
+        if cmd == ecr.CMD_GET_DIAGNOSTIC_INFO:
+            if x:
+                return ['0', self.model, '1.00', now.strftime('%d-%m-%y'), '0000', '0', '0', self.serial_number]
+            return [self.model, '1.00', now.strftime('%d%b%y'), '0000', self.serial_number]
+        if cmd == ecr.CMD_GET_DATE_TIME:
+            return ok + [now.strftime('%d-%m-%y %H:%M:%S DST' if x else '%d-%m-%y %H:%M:%S')]
+        if cmd in (ecr.CMD_SET_DATE_TIME, ecr.CMD_GET_STATUS):
+            return ok
+        if cmd == ecr.CMD_OPEN_FISCAL_RECEIPT:
+            self.receipt = [0, 0.0, 0.0]
+            self.status[2] |= 1 << 3
+            return ['0', str(self.slip + 1)]
+        if cmd == ecr.CMD_FISCAL_SALE:
+            if self.receipt is None:
+                return ['-55']
+            price = float(args[2] or 0)
+            quantity = float(args[3] or 1)
+            self.receipt[0] += 1
+            self.receipt[1] = round(self.receipt[1] + round(price * quantity, 2), 2)
+            tax = int(args[1]) - 1 if args[1].isdigit() else 0
+            self.taxes[tax] = round(self.taxes[tax] + round(price * quantity, 2), 2)
+            return ['0', str(self.slip + 1)]
+        if cmd == ecr.CMD_TOTAL:
+            if self.receipt is None:
+                return ['-55']
+            amount = float(args[1] or 0) or self.receipt[1]
+            if args[0] == '0':
+                self.cash[0] = round(self.cash[0] + min(amount, self.receipt[1]), 2)
+            self.receipt[2] = round(self.receipt[2] + amount, 2)
+            return ['0', 'D' if self.receipt[2] >= self.receipt[1] else 'R', '{0:.2f}'.format(self.receipt[2])]
+        if cmd in (ecr.CMD_FISCAL_CLOSE, ecr.CMD_FISCAL_CANCEL):
+            if self.receipt is None:
+                return ['-55']
+            self.receipt = None
+            self.status[2] &= ~(1 << 3) & 0xff
+            if cmd == ecr.CMD_FISCAL_CLOSE:
+                self.slip += 1
+                self.record = now
+                return ['0', str(self.slip)]
+            return ['0']
+        if cmd == ecr.CMD_RECEIPT_STATE:
+            r = self.receipt or [0, 0.0, 0.0]
+            if x:
+                return ['0', '1' if self.receipt else '0', str(self.slip + 1), str(r[0]),
+                        '{0:.2f}'.format(r[1]), '{0:.2f}'.format(r[2])]
+            return ['1' if self.receipt else '0', str(r[0]), str(int(r[1] * 100)), str(int(r[2] * 100))]
+        if cmd == ecr.CMD_LAST_DOCUMENT:
+            return ok + [str(self.slip)]
+        if cmd == ecr.CMD_LAST_FISCAL_RECORD:
+            return ['0', self.record.strftime('%d-%m-%y %H:%M:%S')]
+        if cmd == ecr.CMD_CASH_IN_OUT:
+            amount = float(args[1] if x else args[0] or 0)
+            if x and args[0] != '0':
+                amount = -amount
+            self.cash[0] = round(self.cash[0] + amount, 2)
+            if amount > 0:
+                self.cash[1] = round(self.cash[1] + amount, 2)
+            elif amount < 0:
+                self.cash[2] = round(self.cash[2] - amount, 2)
+            if x:
+                return ['0'] + ['{0:.2f}'.format(v) for v in self.cash]
+            return ['P'] + [str(int(round(v * 100))) for v in self.cash]
+        if cmd == ecr.CMD_DAILY_TAXATION_INFO:
+            sums = ['{0:.2f}'.format(v) for v in self.taxes]
+            return ['0', '0'] + sums if x else ['0'] + sums[:4]
+        if cmd == ecr.CMD_DAILY_REPORT:
+            self.taxes = [0.0] * 8
+            self.record = now
+            return ['0', '1']
+        if cmd in (ecr.CMD_DISPLAY_CLEAR, ecr.CMD_DISPLAY_UPPER, ecr.CMD_DISPLAY_LOWER):
+            if cmd == ecr.CMD_DISPLAY_CLEAR:
+                self.display = ['', '']
+            else:
+                self.display[0 if cmd == ecr.CMD_DISPLAY_UPPER else 1] = args[0]
+            return ['0']
+        if cmd in (ecr.CMD_OPEN_NONFISCAL_RECEIPT, ecr.CMD_CLOSE_NONFISCAL_RECEIPT, ecr.CMD_NONFISCAL_TEXT):
+            bit = 1 << 5
+            if cmd == ecr.CMD_OPEN_NONFISCAL_RECEIPT:
+                self.status[2] |= bit
+            elif cmd == ecr.CMD_CLOSE_NONFISCAL_RECEIPT:
+                self.status[2] &= ~bit & 0xff
+            return ['0']
+        if cmd == ecr.CMD_PROGRAMMING:
+            key = (args[0], args[1])
+            if len(args) > 2 and args[2] != '':
+                self.parameters[key] = args[2]
+                return ['0']
+            return ['0', self.parameters.get(key, '')]
+        return ['-17']     # Invalid command
+
+
+class EmulatorServer:
+    # Serves one EcrEmulator over TCP, like the Ethernet port of an ECR
+
+    def __init__(self, emulator, host='127.0.0.1', port=0):
+        self.emulator = emulator
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind((host, port))
+        self.sock.listen()
+        self.address = self.sock.getsockname()
+        self.running = False
+
+    def start(self):
+        self.running = True
+        threading.Thread(target=self.serve, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.running = False
+        self.sock.close()
+
+    def serve(self):
+        while self.running:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                return
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            threading.Thread(target=self.session, args=(conn,), daemon=True).start()
+
+    def session(self, conn):
+        packet = bytearray()
+        with conn:
+            while self.running:
+                try:
+                    data = conn.recv(1024)
+                except OSError:
+                    return
+                if not data:
+                    return
+                packet += data
+                while TERMINATOR in packet:
+                    end = packet.index(TERMINATOR) + 1
+                    delay, answer = self.emulator.handle(packet[:end])
+                    del packet[:end]
+                    while delay > SYN_INTERVAL:
+                        time.sleep(SYN_INTERVAL)
+                        conn.sendall(SYN)
+                        delay -= SYN_INTERVAL
+                    if delay > 0:
+                        time.sleep(delay)
+                    conn.sendall(answer)
+
+
+class LoopbackConnector:
+    # Connector talking straight to an EcrEmulator on a clock. With a VirtualClock the
+    # processing delays, SYN keepalives and read timeouts only move the clock, nothing sleeps.
+
+    def __init__(self, emulator, clock, read_timeout=0.3):
+        self.emulator = emulator
+        self.clock = clock
+        self.read_timeout = read_timeout
+        self.online = True      # False: the device stops answering, reads time out
+        self.pending = []       # (ready time, bytes)
+
+    def connect(self):
+        return True
+
+    def write_data(self, data):
+        if not self.online:
+            return
+        delay, answer = self.emulator.handle(bytes(data))
+        t = self.clock.monotonic()
+        while delay > SYN_INTERVAL:
+            t += SYN_INTERVAL
+            delay -= SYN_INTERVAL
+            self.pending.append((t, SYN))
+        self.pending.append((t + delay, answer))
+
+    def read_data(self):
+        # Like a serial read: whatever is ready within the read timeout, else b'' after it
+        timeout_at = self.clock.monotonic() + self.read_timeout
+        if not self.pending or self.pending[0][0] > timeout_at:
+            self.clock.advance_to(timeout_at)
+            return b''
+        t, data = self.pending.pop(0)
+        self.clock.advance_to(t)
+        return data
+
+    def disconnect(self):
+        self.pending = []
@@ -3,841 +3,841 @@ class DatecsErrors:
     def get_message(self, error_code):
         return self.error_list[error_code]
 
-    def __init__(self):
-        self.error_list = {
-            0: 'Operation successful.',
-            -1: 'General error / Unknown error.',
-            -2: 'Create error.',
-            -3: 'Open error',
-            -4: 'Close error',
-            -5: 'Device or resource busy.',
-            -6: 'Timeout expired.',
-            -7: 'The operation is not supported.',
-            -8: 'Memory allocation error.',
-            -9: 'Invalid parameter.',
-            -10: 'Input/Output error',
-            -11: 'CRC error.',
-            -12: 'Flash memory error.',
-            -13: 'EEPROM error',
-            -14: 'Device error.',
-            -15: 'The operation is not implemented.',
-            -16: 'The device or resource does not exists.',
-            -17: 'Invalid command.',
-            -18: 'Not exist object.',
-            -19: 'No more items or operations',
-            -20: 'Command failed',
-            -21: 'Invalid command',
-            -22: 'No registered',
-            -23: 'Some bits in the status bytes of the fiscal device was raised.',
-            -24: 'Trial period has expired.',
-            -25: 'The functionality of your product is time limited. Please contact the support team!',
-
-            -40: 'Device communication exceptions, check if the device is on.',
-            -41: 'Device communication exceptions, check if the device is on.',
-            -42: 'Device communication exceptions, check if the device is on.',
-            -43: 'Device communication exceptions, check if the device is on.',
-            -44: 'Device communication exceptions, check if the device is on.',
-            -45: 'Device communication exceptions, check if the device is on.',
-            -46: 'Device communication exceptions, check if the device is on.',
-            -50: 'The printer is out of paper.',
-            -51: 'General/syntax error',
-
-            -52: 'Incorrect command number in the string',
-            -53: 'Opened fiscal receipt, command not allowed',
-            -54: 'Opened nonfiscal receipt, command not allowed',
-            -55: 'No opened receipt, command not allowed',
-            -56: 'Fiscal memory full ',
-            -57: 'Fiscal memory error (read/write failed/corrupt, memory in read-only state or last entry is corrupt)',
-            -58: 'Command cannot be executed in current fiscal mode ',
-            -59: 'Ram reset after powering the device',
-            -60: 'Incoming data has syntax error or wrong command number',
-            -61: 'Failure in the printing mechanism',
-            -62: 'Fiscal memory is in read only mode',
-            -63: 'Tax terminal not responding',
-            -64: 'Electronic journal is full',
-            -201: 'Class exceptions due to wrong parameters/bugs',
-            -202: 'Class exceptions due to wrong parameters/bugs',
-            -203: 'Class exceptions due to wrong parameters/bugs',
-            -204: 'Class exceptions due to wrong parameters/bugs',
-            -205: 'Class exceptions due to wrong parameters/bugs',
-            -206: 'Class exceptions due to wrong parameters/bugs',
-            -207: 'Class exceptions due to wrong parameters/bugs',
-            -208: 'Class exceptions due to wrong parameters/bugs',
-            -209: 'Class exceptions due to wrong parameters/bugs',
-            -210: 'Class exceptions due to wrong parameters/bugs',
-            -221: 'Class exceptions due to wrong parameters/bugs',
-            -222: 'Class exceptions due to wrong parameters/bugs',
-            -223: 'Class exceptions due to wrong parameters/bugs',
-            -224: 'Class exceptions due to wrong parameters/bugs',
-            -225: 'Class exceptions due to wrong parameters/bugs',
-            -226: 'Class exceptions due to wrong parameters/bugs',
-            -227: 'Class exceptions due to wrong parameters/bugs',
-            -228: 'Class exceptions due to wrong parameters/bugs',
-            -229: 'Class exceptions due to wrong parameters/bugs',
-            -220: 'Class exceptions due to wrong parameters/bugs',
-
-            -10000: 'Wrong logical number, check your string or file',
-            -10001: 'Function ''EXECUTE_FILE'' - execute file does not exist',
-            -10002: 'Function ''EXECUTE_FILE'' - wrong file format.',
-            -10003: 'Function ''OPEN_TCPIP'' - wrong IP address string',
-
-            -5000: 'Exception in "OPEN_PORT" function - check your parameters',
-            -5001: 'Exception in "EXECUTE_STRING" function - check your parameters',
-            -5002: 'Exception in "EXECUTE_FILE" function - check your parameters',
-            -5003: 'Exception in "CLOSE_PORT" function ',
-            -5004: 'Exception in "GET_SERIAL_NUMBER'' function  - check your parameters',
-            -5005: 'Exception in "GET_SERIAL_NUMBER_TCPIP'' function  - check your parameters',
-            -5006: 'Exception in "OPEN_TCPIP" function - check your parameters',
-            -5007: 'Exception in "CLOSE_TCPIP" function ',
-
-            -10500: 'Missing input parameter. [INPUT]',
-            -10502: 'Check for exceeding the upper limit of the parameter (length). [INPUT]',
-            -10503: 'Check for exceeding the lower limit of the parameter (length). [INPUT]',
-            -10504: 'Check for availability in the enumerated list of values. [INPUT]',
-            -10505: 'Check whether the parameter is real number. [INPUT]',
-            -10506: 'Check for exceeding the upper limit of the parameter (Currency value). [INPUT]',
-            -10507: 'Check for exceeding the lower limit of the parameter (Currency value). [INPUT]',
-            -10508: 'Check for exceeding the upper limit of the parameter (QTY value). [INPUT]',
-            -10509: 'Check for exceeding the lower limit of the parameter (QTY value). [INPUT]',
-            -10510: 'Check whether the parameter is an integer value. [INPUT]',
-            -10511: 'Check for exceeding the upper limit of the parameter (INT value). [INPUT]',
-            -10512: 'Check for exceeding the lower limit of the parameter (INT value). [INPUT]',
-            -10513: 'Check for exceeding the upper limit of the parameter (length). [OUTPUT]',
-            -10514: 'Check for exceeding the lower limit of the parameter (length). [OUTPUT]',
-            -10515: 'Check for availability in the enumerated list of values. [OUTPUT]',
-            -10516: 'Check whether the parameter is real number. [OUTPTUT]',
-            -10517: 'Check for exceeding the upper limit of the parameter (Currency value). [OUTPUT]',
-            -10518: 'Check for exceeding the lower limit of the parameter (Currency value). [OUTPUT]',
-            -10519: 'Check for exceeding the upper limit of the parameter (QTY value). [OUTPUT]',
-            -10520: 'Check for exceeding the lower limit of the parameter (QTY value). [OUTPUT]',
-            -10521: 'Check whether the parameter is an integer value. [OUTPUT]',
-            -10522: 'Check for exceeding the upper limit of the parameter (INT value). [OUTPUT]',
-            -10523: 'Check for exceeding the lower limit of the parameter (INT value). [OUTPUT]',
-            -10524: 'Missing output parameter. [OUTPUT]',
-            -10525: 'Timeout error.',
-            -10526: 'Command not found.(By name)',
-            -10527: 'Command not found.(By values)',
-            -10528: 'Successfully canceled PinPad transaction (automatically  - from settings)',
-            -10529: 'The CSV file is not in format (";";";)',
-            -10530: 'This is a header row.',
-
-            -16500: 'The communication thread is not started yet.',
-            -16501: 'The communication thread is busy - execution of the command.',
-            -16502: 'The communication thread is busy - waiting for answer.',
-            -16503: 'The communication thread is busy - waiting for pinpad event.',
-            -16504: 'The communication thread is busy - communication with a Borika server.',
-            -16505: 'Unknown status - general error.',
-            -16506: 'Received an unknown sub event value.',
-            -16507: 'Received an unknown event value. Unknown or wrong protocol.',
-            -16508: 'Unsupported socket ID. Wrong protocol.',
-            -16509: 'Unsupported socket value for "TYPE". Wrong protocol.',
-            -16510: 'The program can''t connect to server.',
-            -16511: 'The tags list is empty.',
-            -16512: 'Wrong protocol - readByte method:(missing  $3E  byte).',
-            -16513: 'Wrong protocol - readByte method:(missing event delimiter [$00]  byte).',
-            -16514: 'Wrong protocol - readByte method:(missing byte for answer type determination).',
-            -16515: 'Wrong protocol - readByte method:(missing status byte).',
-            -16516: 'Internal error - cannot make a transaction.',
-            -16517: 'Internal error - cannot find the transaction.',
-
-            -23000: 'No internet connection.',
-            -23001: 'Client can not connect to the server.',
-            -23002: 'Client can not register calback.',
-            -23003: 'Client can not disconnect properly from the server.',
-            -23004: 'Client can not get user table from the server.',
-            -23005: 'Client can not clear old transactions from the server.',
-            -23006: 'Client can not broadcast the message.',
-            -23007: 'Client can not execute update method (2).',
-
-            -33000: 'Load from to failed.',
-            -33001: 'Save to file failed',
-            -33002: 'Wrong protocol - readByte method:(missing SOH byte)',
-            -33003: 'Wrong protocol - readByte method:(missing SEQ byte).',
-            -33004: 'Wrong protocol - readByte method:(missing EOT byte)',
-            -33005: 'Wrong protocol - readByte method:(missing ENQ byte)',
-            -33006: 'Wrong protocol - readByte method:(missing BCC byte)',
-            -33007: 'Wrong protocol - readByte method:(missing ETX byte)',
-            -33008: 'Error due parsing. Something is wrong in the script line.',
-            -33009: 'The script is empty.',
-            -33010: 'The script execution was interrupted by user.',
-            -33011: 'Duplicate label',
-            -33012: 'Invalid parameter value',
-            -33013: 'FiscalDevice component is not assigned to scrypt engine.',
-            -33014: 'Misc component is not assigned to scrypt engine.',
-            -33015: 'The index is out of range. The value is greater than numbers of the fields in the answer.',
-            -33016: 'Misc component not assigned.',
-            -33017: 'Error container component not assigned.',
-            -33018: 'Description container component not assigned.',
-            -33019: 'Connector component not assigned.',
-            -33020: 'Device depended method is not prepared.',
-            -33021: 'Fiscal device component not assigned',
-            -33022: 'Device not connected',
-            -33023: 'Device is connected - you can not change these values until the device is still connected.',
-            -33024: 'Invalid file name.',
-            -33025: 'Unknown device model',
-            -33026: 'Transport protocol not supported.',
-            -33027: 'Not supported script engine',
-            -33028: 'Device answer is not by its protocol.',
-            -33029: 'No files for download',
-            -33030: 'Delete file - access denied.',
-            -33031: 'The operation is canceled by user.',
-            -33032: 'Incorrect checksum',
-            -33033: 'Empty stamp name.',
-            -33034: 'The stamp name length must be <= 12 symbols.',
-            -33035: 'Invalid command name.',
-            -33036: 'Invalid param index.',
-            -33037: 'Invalid param name.',
-            -33038: 'Command not found.',
-            -33039: 'Invalid enumerate list index.',
-            -33040: 'No input params for this command.',
-            -33041: 'Param not found.',
-            -33042: 'No output params - general error.',
-            -33043: 'The COM Server not assigned.',
-            -33044: 'Unsupported document type. Use other method for this type!',
-            -33045: 'Sniffer component not assigned.',
-            -33046: 'Connection is not active',
-            -33047: 'File: Access denied',
-            -33048: 'Transaction Header not found.',
-            -33049: 'The header status for this transaction is not in proper state for this operation.',
-            -33050: 'Not all items for this transaction are prepared.',
-            -33051: 'Headers list is empty.',
-            -33052: 'The status of the transaction is still "executing".',
-            -33053: 'The script item status is not in proper state for this operation.',
-            -33054: 'One or more of the script items contain a wrong value.',
-            -33055: 'Common logical error: answer',
-            -33056: 'The transaction queue engine reject the command',
-            -33057: 'The transaction queue engine can not delete an old transaction.',
-            -33058: 'The script item is not found.',
-            -33059: 'The header item is not found.',
-            -33060: 'The errors list is empty.',
-            -33061: 'The error item is not found. Please check the value of ID!',
-            -33062: 'You have not enough rights to do this operation.',
-
-            -100000: 'Function ''OPEN_PORT'' – the serial key is wrong',
-
-            #  Firmware errors Group 'A'
-            - 150001: 'Syntax error',
-            -150002: 'Invalid command ',
-            -150003: 'Not permited ',
-            -1500010: 'Printer is blocked',
-
-            -150100: 'Clock not set ',
-            -150101: 'Out of paper ',
-            -150102: 'Journal error ',
-            -150103: 'Arithmetic overflow ',
-            -150104: 'Invalid password ',
-            -150105: 'Less than 2 lines in header ',
-            -150106: 'Invalid serial number ',
-            -150107: 'Invalid bar code data ',
-            -150108: 'Invalid request ',
-            -150109: 'Cutter error ',
-            -150110: 'Presenter error ',
-            -150111: 'Data contain FISCAL',
-            -150112: 'Wrong invoice number ',
-            -150113: 'UNP missing ',
-            -150114: 'UNP counter overflow ',
-            -150115: 'UNP must increase',
-            -150116: 'Not logged in',
-            -150117: 'Currency not defined',
-
-            -150200: 'Receipt is open',
-            -150201: 'No receipt is open',
-            -150202: 'Receipts after Z-report',
-            -150203: 'No receipts after Z-report',
-            -150204: 'More than 24 hours without Z-report',
-            -150205: 'Date and time before last FM record',
-            -150206: 'Date and time before last JNL record',
-            -150207: 'Probably wrong date and time',
-            -150208: 'Not in service mode',
-            -150209: 'Cannot read from el. journal',
-            -150210: 'Cannot write to el. journal',
-            -150211: 'Cannot format el. journal',
-            -150212: 'Cannot open el. journal document',
-            -150213: 'No access to external display',
-            -150214: 'Journal near end',
-            -150215: 'Cannot format valid el. journal',
-            -150216: 'El. journal number too big',
-            -150217: 'No data for document found',
-            -150218: 'Journal paper width different ',
-            -150231: 'Journal buffer full ',
-            -150232: 'Journal buffer write failed',
-
-            -150300: 'Fiscal memory not formatted',
-            -150301: 'Serial number not set',
-            -150302: 'VAT number not set',
-            -150303: 'VAT rates not set',
-            -150304: 'All VAT rates disabled',
-            -150305: 'Printer is not fiscalized',
-            -150306: 'Printer is fiscalized',
-            -150307: 'No records in fiscal memory',
-            -150308: 'Fiscal memory not responding',
-            -150309: 'Too many records in fiscal memory',
-            -150310: 'Serial number already set',
-            -150311: 'Fiscal memory is read only',
-            -150312: 'Fiscal memory not found',
-            -150313: 'Fiscal memory read error',
-            -150314: 'VAT rates or decimals changed',
-
-            -150400: 'PLU does not exist ',
-            -150401: 'Department does not exist ',
-            -150402: 'Invalid VAT group ',
-            -150403: 'VAT group is disabled ',
-            -150404: 'Too many sales in receipt ',
-            -150405: 'Payment or discount/mark up done ',
-            -150406: 'Negative sum or quantity ',
-            -150407: 'Discount larger than price ',
-            -150408: 'Void of non-existing sale ',
-            -150409: 'Payment is started ',
-            -150410: 'Payment type not programmed ',
-            -150411: 'Total is already paid ',
-            -150412: 'Total is not entirely paid ',
-            -150413: 'Not enough cash available ',
-            -150414: 'Cash payment only ',
-            -150415: 'Change not allowed ',
-            -150416: 'Non-zero sum for this operator ',
-            -150417: 'Non-zero sum for this PLU ',
-            -150418: 'Non-zero sum for this department ',
-            -150419: 'No free PLUs for programming ',
-            -150420: 'Too many lines in receipt ',
-            -150421: 'No receipt copy data ',
-            -150422: 'Non-zero sum for this payment type ',
-            -150423: 'PLU is sold in this receipt ',
-            -150424: 'Invalid fuel PLU ',
-            -150425: 'Fuels may be sold using PLU only ',
-            -150426: 'Not gas station ',
-            -150427: 'More than 200 departments with sales ',
-            -150428: 'No data for receipt copy ',
-            -150429: 'Fuel storno not allowed ',
-            -150430: 'Invalid storno date and time ',
-            -150431: 'Zero price ',
-            -150432: 'Too many fuel sales in receipt ',
-            -150433: 'Already paid non-cash ',
-            -150434: 'Payment transaction denied',
-            -150435: 'Non-zero sums',
-            -150436: 'No tip allowed',
-
-            -150800: 'Printer is not registered ',
-            -150801: 'No invoice number ',
-            -150802: 'Invoice number outside interval ',
-            -150803: 'No invoice numbers interval programmed ',
-            -150804: 'No customer data entered ',
-            -150805: 'Customer data already entered ',
-            -150806: 'Not an invoice ',
-            -150807: 'Tax terminal error ',
-            -150808: 'GPRS-modem not responding ',
-            -150809: 'GPRS-modem busy ',
-            -150810: 'No SIM-card in modem ',
-            -150811: 'SIM-card different from registered one ',
-            -150812: 'Outdated petrol station info ',
-            -150813: 'No starting data command ',
-            -150814: 'Not crypted firmware ',
-            -150815: 'Firmware too big ',
-            -150816: 'Start command B needed ',
-            -150817: 'End command  E needed ',
-            -150818: 'XML line too long ',
-            -150819: 'This is an invoice ',
-
-            #  Firmware errors Group B
-            -100001: 'General error in fiscal device: In - out error( cannot read or write )',
-            -100002: 'General error in fiscal device: Wrong checksum',
-            -100003: 'General error in fiscal device: No more data',
-            -100004: 'General error in fiscal device: The element is not found',
-            -100005: 'General error in fiscal device: There are no records found',
-            -100006: 'General error in fiscal device: The operation is aborted',
-            -100007: 'Wrong mode( standart, training...)  is selected.',
-            -100008: 'General error in fiscal device: Device is not ready',
-            -100009: 'General error in fiscal device: Nothing to print',
-
-            -100100: 'Fiscal memory error: Fiscal memory is busy',
-            -100101: 'Fiscal memory error: Fiscal memory failure. Could not read or write',
-            -100102: 'Fiscal memory error: Forbidden write in fiscal memory',
-            -100103: 'Fiscal memory error: Wrong address in fiscal memory',
-            -100104: 'Fiscal memory error: Wrong size in fiscal memory',
-            -100105: 'Fiscal memory error: Fiscal memory is not connected',
-            -100106: 'Fiscal memory error: Wrong checksum in fiscal memory( invalid data )',
-            -100107: 'Fiscal memory error: Empty block in fiscal memory',
-            -100108: 'Fiscal memory error: Maximum number of block  in fiscal memory',
-            -100109: 'Fiscal memory error: Wrong range in fiscal memory',
-            -100110: 'Fiscal memory error: Empty range in fiscal memory',
-            -100111: 'Fiscal memory error: New module in fiscal memory',
-            -100112: 'Fiscal memory error: Fiscal memory is not empty',
-            -100113: 'Fiscal memory error: Fiscal memory is not equal',
-            -100114: 'Fiscal memory error: Fiscal memory is full',
-            -100115: 'Fiscal memory error: Fiscal memory needs update',
-            -100116: 'Fiscal memory error: Fiscal memory is blocked',
-
-            -100400: 'Line thermal printer mechanism error: Power supply error ( 3,3 V )',
-            -100401: 'Line thermal printer mechanism error: Power supply error ( 24V or 8V )',
-            -100402: 'Line thermal printer mechanism error: Head overheating',
-            -100403: 'Line thermal printer mechanism error: Paper end',
-            -100404: 'Line thermal printer mechanism error: Cover is open',
-            -100405: 'Line thermal printer mechanism error: Near paper end',
-            -100406: 'Line thermal printer mechanism error: Mark sensor - not used',
-            -100407: 'Line thermal printer mechanism error: Cutter error',
-            -100414: 'Printer on time is overrun.',
-
-            -100500: 'System error: Memory structure error',
-            -100501: 'System error: Error in RAM',
-            -100502: 'System error: Flash memory error',
-            -100503: 'System error: SD card error',
-            -100504: 'System error: Invalid message file',
-            -100505: 'System error: Fiscal memory error( could not write or read )',
-            -100506: 'System error: No RAM battery',
-            -100508: 'System error: Real time clock error',
-            -100509: 'System error: Memory error',
-
-            -101000: 'Common logical error: No heap memory( cannot allocate memory for operation )',
-            -101001: 'Common logical error: File manipulate error',
-            -101003: 'Common logical error: Operation is rejected',
-            -101004: 'Common logical error: Bad input. Some of the data or parameters are incorrect',
-            -101005: 'Common logical error: In Application Programming error',
-            -101006: 'Common logical error: The execution of the operation is not possible',
-            -101007: 'Common logical error: Timeout. The time for waiting execution is out',
-            -101007: 'Common logical error: Timeout. The time for waiting execution is out',
-            -101008: 'Common logical error: Invalid time',
-            -101009: 'Common logical error: The operation is cancelled',
-            -101010: 'Common logical error: Invalid format',
-            -101011: 'Common logical error: Invalid data',
-            -101012: 'Common logical error: Data parsing error',
-            -101013: 'Common logical error: Hardware configuration error',
-            -101014: 'Common logical error: Access denied',
-            -101015: 'Wrong data length',
-            -101016: 'Error during verification of Z reports',
-            -101017: 'Common logical error:  No permission',
-
-            -102000: 'Battery error: Low battery',
-            -102001: 'Battery error: Low battery warning',
-            -102002: 'Operator error: Wrong operator password',
-            -102003: 'ECR error: ID number is empty',
-            -102004: 'Bluetooth error: Bluetooth is not found',
-            -102005: 'Display error: Display is not connected',
-            -102006: 'Printer error: Printer is not connected',
-            -102007: 'SD card error: SD card not present',
-            -102008: 'SD card error: SD2 card not present',
-            -102009: 'ECR error: VAT rates is not set.',
-            -102010: 'ECR error: Header lines are empty.',
-            -102011: 'User is registered by VAT, but number of the user is not entered.',
-            -102012: 'ECR error: FM number is empty',
-            -102013: 'ECR error: Serviceman name is empty',
-            -102014: 'ECR error: Serviceman ID is empty',
-            -102015: 'ECR error: Tax office ID is empty!',
-            -102016: 'ECR error: Wrong format',
-            -102017: 'ECR error: TAX number is empty',
-            -102018: 'ECR error: ID number is wrong',
-            -102019: 'ECR error: Date and time are earlier than date and time of previous Z report.',
-            -102020: 'ECR error: The software password is not entered',
-
-            -103000: 'PLU database error: PLU database is not found',
-            -103001: 'PLU database error: PLU code already exists',
-            -103002: 'PLU database error: Barcode already exists',
-            -103003: 'PLU database error: PLU database is full',
-            -103004: 'PLU database error: PLU has turnover',
-            -103005: 'PLU database error: In the PLU base has an article with same name.',
-            -103006: 'PLU database error: PLU name is not unique.',
-            -103007: 'PLU database error: Database format is not compatible.',
-            -103008: 'PLU database error: Can''t open the PLU database file',
-
-            - 104000: 'Service operation error: Z report is needed for this operation',
-            -104001: 'Service operation error: Service jumper is needed for this operation',
-            -104002: 'Service operation error: Service password is needed for this operation',
-            -104003: 'Service operation error: The operation is forbidden',
-            -104004: 'Service operation error: Service intervention is needed',
-            -104005: 'Service operation error: All clearing report is needed.',
-            -104006: 'Service operation error: Z report closed.',
-            -104007: 'Service operation error: Montly report needed.',
-            -104008: 'Service operation error: Year report needed.',
-            -104009: 'Service operation error: Backup needed.',
-            -104011: 'Clearing report for operator is needed.',
-            -104012: 'Clearing report for item group is needed.',
-            -104013: 'VAT changes is needed.',
-
-            -105000: 'EJ error: No records in EJ',
-            -105001: 'EJ error: Cannot add to EJ',
-            -105003: 'EJ error: Signature key version is changed -> impossible check',
-            -105004: 'EJ error: Bad record in EJ',
-            -105005: 'EJ error: Generate signature error( cannoct generate signature )',
-            -105006: 'EJ error: Wrong type of document to sign',
-            -105007: 'EJ error: Document is already signed',
-            -105008: 'EJ error: EJ is not from this device',
-            -105009: 'EJ error: EJ is almost full',
-            -105010: 'EJ error: EJ is full',
-            -105011: 'EJ error: Wrong format of EJ',
-            -105012: 'The electronic journal is not ready.',
-            -105013: 'Error in EJ structure. Create new one.',
-
-            -106000: 'Client database error: Firm does not exist',
-            -106001: 'Client database error: Firmcode already exists',
-            -106002: 'Client database error: EIK already exists',
-            -106003: 'Client database error: Firm database is full',
-            -106004: 'Client database error: Firm database is not found',
-
-            -108000: 'Discount card database error: Discount card does not exist',
-            -108001: 'Discount card database error: Discount card already exists',
-            -108002: 'Discount card database error: Barcode already exists',
-            -108003: 'Discount card database error: Discount card database is full',
-            -108004: 'Discount card database error: Discount card not found',
-
-            -110100: 'Device error: Communication error',
-            -110101: 'Device error: Wrong struct format',
-            -110102: 'Device error: ST flag is active',
-            -110103: 'Device error: Invalid data',
-            -110104: 'Device error: Device is not fiscalized',
-            -110105: 'Device error: Device is already fiscalized',
-            -110106: 'Device error: Device is in service mode',
-            -110107: 'Device error: Service date is passed',
-            -110108: 'Device error: Day( shift ) is open',
-            -110109: 'Device error: Day( shift ) is closed',
-            -110110: 'Device error: Z-report number and shift number are not equal',
-            -110111: 'Device error: Only admin has permition',
-            -110112: 'Device error: Fiscal memory is closed',
-
-            -110200: 'NAP server error: Error open session',
-            -110201: 'NAP server error: Error preparing data for server',
-            -110202: 'NAP server error: There is unsent data',
-            -110203: 'NAP server error: Receiving data error',
-            -110204: 'NAP server error: Empty data',
-            -110205: 'NAP server error: Server negative answer',
-            -110206: 'NAP server error: Wrong answer format',
-            -110208: 'NAP server error: Server exception',
-            -110209: 'NAP server error: Not registered on server',
-            -110209: 'NAP server error: Not registered on server',
-            -110210: 'NAP server error: Communication with NAP server is blocked',
-            -110211: 'NAP server error: Modem error',
-            -110212: 'NAP server error: NAP is busy',
-            -110213: 'NAP server error: Already registered',
-            -110214: 'NAP server error: Wrong PS type',
-            -110215: 'NAP server error: Deregistered in NAP',
-            -110216: 'NAP server error: Wrong IMSI number',
-            -110217: 'NAP server error: Device is blocked( maximum Z-reports )',
-            -110218: 'NAP server error: Wrong FD( Fiscal device ) type',
-            -110219: 'NAP server error: The ECR is blocked by server',
-            -110220: 'NAP server error: The ECR is blocked - server error',
-            -110221: 'NAP server error: No server address',
-            -110222: 'NAP server error: Max. registrations reached.',
-            -110225: 'NAP server error: Device is blocked( unsent sales documents )',
-            -110226: 'NAP server error: Communication with NAP server is blocked. '
-                     'More than 24 hours from last sent receipt.',
-
-            -110300: 'Working error: Invalid file',
-            -110301: 'Working error: Invalid parameters',
-
-            -110400: 'Connection error: Connection init error',
-            -110401: 'NRA connection error: Wrong parameteres',
-            -110402: 'NRA connection error: No GPRS',
-            -110403: 'Connection error: Failed to initialize connection with NRA Repository Server',
-            -110404: 'Connection error: Wrong answer format',
-            -110405: 'Connection error: Wrong configuration',
-            -110420: 'NRA server returns error',
-            -110481: 'Error in answer from NRA server on parameter 1',
-            -110482: 'Error in answer from NRA server on parameter 2',
-            -110483: 'Error in answer from NRA server on parameter 3',
-            -110484: 'Error in answer from NRA server on parameter 4',
-            -110485: 'Error in answer from NRA server on parameter 5',
-            -110486: 'Error in answer from NRA server on parameter 6',
-            -110487: 'Error in answer from NRA server on parameter 7',
-            -110488: 'Error in answer from NRA server on parameter 8',
-            -110489: 'Error in answer from NRA server on parameter 9',
-            -110490: 'Error in answer from NRA server on parameter 10',
-            -110491: 'Error in answer from NRA server on parameter 11',
-            -110492: 'Error in answer from NRA server on parameter 12',
-            -110493: 'Error in answer from NRA server on parameter 13',
-            -110494: 'Error in answer from NRA server on parameter 14',
-            -110495: 'Error in answer from NRA server on parameter 15',
-            -110496: 'Error in answer from NRA server on parameter 16',
-
-            -110500: 'Modem error: error in communication between device and modem',
-            -110501: 'Modem error: No SIM card',
-            -110502: 'Modem error: Wrong PIN of SIM',
-            -110503: 'Modem error: Cannot register to mobile network',
-            -110504: 'Modem error: No PPP connection( cannot connect )',
-            -110505: 'Modem error: Wrong modem configuration( for example - no programmed apn )',
-            -110506: 'Modem error: Modem initializing',
-            -110507: 'Modem error: Modem is not ready',
-            -110508: 'Modem error: Remove SIM card',
-            -110509: 'Modem error: Modem found a cell',
-            -110510: 'Modem error: Modem does not find a cell',
-            -110511: 'Modem error: Failed lot days',
-
-            -110601: 'Modem error: Device is not connected to AP( access point )',
-
-            -110700: 'Network error: Cannot resolve address',
-            -110701: 'Network error: Cannot open socket for communication with server',
-            -110702: 'Network error: Connection error( cannot connect to a server )',
-            -110703: 'Network error: Config error( for example: no server address )',
-            -110704: 'Network error: Connection socket is already opened',
-            -110705: 'Network error: SSL communication error( something went wrong in cryptographic protocol )',
-            -110706: 'Network error: HTTP communication error( something went wrong in http protocol )',
-
-            -110800: 'Tax terminal error: No error',
-            -110801: 'Tax terminal error: Unknown ID',
-            -110802: 'Tax terminal error: Invalid token( key from the server )',
-            -110803: 'Tax terminal error: Protocol error',
-            -110804: 'Tax terminal error: The command is unknown',
-            -110805: 'Tax terminal error: The command is not supported',
-            -110806: 'Tax terminal error: Invalid configuration',
-            -110807: 'Tax terminal error: SSL is not allowed',
-            -110808: 'Tax terminal error: Invalid request number',
-            -110809: 'Tax terminal error: Invalid retry request',
-            -110810: 'Tax terminal error: Cannot cancel ticket',
-            -110811: 'Tax terminal error: More than 24 hours from shift opening',
-            -110812: 'Tax terminal error: Invalid login name or password',
-            -110813: 'Tax terminal error: Incorrect request data',
-            -110814: 'Tax terminal error: Not enough cash',
-            -110815: 'Tax terminal error: Blocked from server',
-            -110854: 'Tax terminal error: Service temporarily unavailable',
-            -110855: 'Tax terminal error: Unknown error',
-
-            -111000: 'Registration mode error: Common error, followed by deliting all data for the command',
-            -111001: 'Registration mode error: Common error, followed by partly deliting data for the command',
-            -111002: 'Registration mode error: Syntax error. Check the parameters of the command',
-            -111003: 'Registration mode error: Cannot do operation',
-            -111004: 'Registration mode error: PLU code was not found',
-            -111005: 'Registration mode error: Forbidden VAT',
-            -111006: 'Registration mode error: Overflow in multiplication of quantity and price',
-            -111007: 'Registration mode error: PLU has no price',
-            -111008: 'Registration mode error: Group is not in range',
-            -111009: 'Registration mode error: Department is not in range',
-            -111010: 'Registration mode error: BAR code does not exist',
-            -111011: 'Registration mode error: Overflow of the PLU turnover',
-            -111012: 'Registration mode error: Overflow of the PLU quantity',
-            -111013: 'Registration mode error: ECR daily registers overflow',
-            -111014: 'Registration mode error: Bill total register overflow',
-            -111015: 'Registration mode error: Receipt is opened',
-            -111016: 'Registration mode error: Receipt is closed',
-            -111017: 'Registration mode error: No cash in ECR',
-            -111018: 'Registration mode error: Payment is initiated',
-            -111019: 'Registration mode error: Maximum number of sales in receipt',
-            -111020: 'Registration mode error: No transactions',
-            -111021: 'Registration mode error: Possible negative turnover',
-            -111022: 'Registration mode error: Foreign payment has change',
-            -111023: 'Registration mode error: Transaction is not found in the receipt',
-            -111024: 'Registration mode error: End of 24 hour blocking',
-            -111025: 'Registration mode error: Invalid invoice range',
-            -111026: 'Registration mode error: Operation is cancelled by operator',
-            -111027: 'Registration mode error: Operation approved by POS',
-            -111028: 'Registration mode error: Operation is not approved by POS',
-            -111029: 'Registration mode error: POS terminal communication error',
-            -111030: 'Registration mode error: Multiplication of quantity and price is 0',
-            -111031: 'Registration mode error: Value is too big',
-            -111032: 'Registration mode error: Value is bad',
-            -111033: 'Registration mode error: Price is too big',
-            -111034: 'Registration mode error: Price is bad',
-            -111035: 'Registration mode error: Operation all void is selected to be executed',
-            -111036: 'Registration mode error: Only all void operation is permitted',
-            -111040: 'Registration mode error: Restaurant: There is no free space for other purchases',
-            -111041: 'Registration mode error: Restaurant: There is no free space for new acount',
-            -111042: 'Registration mode error: Restaurant: Account is already opened',
-            -111043: 'Registration mode error: Restaurant: Wrong index',
-            -111044: 'Registration mode error: Restaurant: Account is not found',
-            -111045: 'Registration mode error: Restaurant: Not permitted( only for admins )',
-            -111046: 'Registration mode error: non-fiscal receipt is opened',
-            -111047: 'Registration mode error: fiscal receipt is opened',
-            -111048: 'Registration mode error: Buyers TIN is already entered',
-            -111049: 'Registration mode error: Buyers TIN is not entered',
-            -111050: 'Registration mode error: Payment is not initiated',
-            -111051: 'Registration mode error: Receipt type mismatch',
-            -111052: 'Registration mode error: Receipt total limit is reached',
-            -111053: 'Registration mode error: Sum cannot be divided by the minimum coin',
-            -111054: 'Registration mode error: Sum must be <= payment amount',
-            -111055: 'Registration mode error: Sum of voucher must be entered when paying with voucher',
-            -111056: 'Registration mode error: Total must be done when paying with voucher and sum > total',
-            -111057: 'Registration mode error: Payment with foreign currency is disabled',
-            -111058: 'Registration mode error: Payment with foreign currency is impossible',
-            -111059: 'Registration mode error: Sum must be bigger or equal to payment amount',
-            -111060: 'Registration mode error: Safe opening is disabled',
-            -111061: 'Registration mode error: Forbidden payment',
-            -111062: 'Registration mode error: Forbidden key for surcharge/discount',
-            -111063: 'Registration mode error: Entered sum is bigger than receipt sum',
-            -111064: 'Registration mode error: Entered sum is smaller than receipt sum',
-            -111065: 'Registration mode error: Fiscal printer: Sum of receipt is 0.',
-            -111066: 'Registration mode error: Fiscal printer: Operation VOID is executed. Close receipt is needed',
-            -111067: 'Registration mode error: Storno receipt is opened',
-            -111068: 'Registration mode error: Sum is not entered',
-            -111069: 'Registration mode error: Price type is invalid',
-            -111070: 'Registration mode error: Linked surcharge is forbidden',
-            -111071: 'Registration mode error: Negative price is forbidden',
-            -111072: 'Registration mode error: More than 1 VAT in one receipt is not allowed',
-            -111073: 'Registration mode error: Pinpad error',
-            -111074: 'Registration mode error: Buyer data is wrong',
-            -111075: 'Registration mode error: Vat system disable.',
-            -111076: 'Operator not logged in.',
-            -111077: 'The receipt date is early on last date in fiscal memory.',
-            -111078: 'Correction receipt data is not entered!',
-            -111079: 'Fractional quantity!',
-            -111080: 'Registration mode error: Registration mode error: Out of stock',
-            -111081: 'Registration mode error: Must pushing of the STL before TL.',
-            -111082: 'Package does not exist',
-            -111083: 'Measuring unit not found',
-            -111084: 'Category not found in the data base',
-            -111085: 'Invalid department name',
-            -111086: 'Bank terminal not configured',
-            -111089: 'Entered price is bigger than the programmed',
-            -111090: 'Fix PLU''s price',
-            - 111091: 'Incorect sign agent.',
-            -111092: 'Voucher payment cannot have change',
-            -111093: 'Sum for advance payment is bigger than the sum of article',
-            -111094: 'Payment in storno can not have change',
-            -111095: 'Invalid parameter - PLU is not defined as excise PLU',
-            -111096: 'Excise stamp of an excise PLU is not entered',
-            -111097: 'SALE FORBIDDEN (excise stamp is not valid)',
-
-            -111500: 'Pinpad error: No error from pinpad',
-            -111501: 'Pinpad error: General unicreditbulbank icon error',
-            -111502: 'Pinpad error: Not valid command or sub command code',
-            -111503: 'Pinpad error: Invalid parameter',
-            -111504: 'Pinpad error: The address is outside limits',
-            -111505: 'Pinpad error: The value is outside limits',
-            -111506: 'Pinpad error: The length is outside limits',
-            -111507: 'Pinpad error: The action is not permited in current state',
-            -111508: 'Pinpad error: There is no data to be returned',
-            -111509: 'Pinpad error: Timeout occurs',
-            -111510: 'Pinpad error: Invalid key number',
-            -111511: 'Pinpad error: Invalid key attributes(usage)',
-            -111512: 'Pinpad error: Calling of non-existing device',
-            -111513: 'Pinpad error: (Not used in this FW version)',
-            -111514: 'Pinpad error: Pin entering limit exceed',
-            -111515: 'Pinpad error: General error in flash commands',
-            -111516: 'Pinpad error: General hardware unicreditbulbank error',
-            -111517: 'Pinpad error: Invalid code check (Not used in this FW version)',
-            -111518: 'Pinpad error: The button CANCEL is pressed',
-            -111519: 'Pinpad error: Invalid signature',
-            -111520: 'Pinpad error: Invalid data in header',
-            -111521: 'Pinpad error: Incorrect password',
-            -111522: 'Pinpad error: Invalid key format',
-            -111523: 'Pinpad error: General unicreditbulbank error in smart card reader',
-            -111524: 'Pinpad error: Error code returned from HAL functions',
-            -111525: 'Pinpad error: Invalid key (may not be present)',
-            -111526: 'Pinpad error: The PIN length is less than 4 or bigger than 12',
-            -111527: 'Pinpad error: Issuer or ICC key invalid remainder length',
-            -111528: 'Pinpad error: Not initialized (Not used in this FW version)',
-            -111529: 'Pinpad error: Limit is reached (Not used in this FW version)',
-            -111530: 'Pinpad error: Invalid sequence (Not used in this FW version)',
-            -111531: 'Pinpad error: The action is not permitted',
-            -111532: 'Pinpad error: TMK is not loaded. The action cannot be executed',
-            -111533: 'Pinpad error: Wrong key format',
-            -111534: 'Pinpad error: Duplicated key',
-            -111535: 'Pinpad error: General keyboard error',
-            -111536: 'Pinpad error: The keyboard is no calibrated.',
-            -111537: 'Pinpad error: Keyboard bug detected.',
-            -111538: 'Pinpad error: The device is busy, try again',
-            -111539: 'Pinpad error: Device is tampered',
-            -111540: 'Pinpad error: Error in encrypted head',
-            -111541: 'Pinpad error: The button OK is pressed',
-            -111542: 'Pinpad error: Wrong PAN',
-            -111543: 'Pinpad error: Out of memory',
-            -111544: 'Pinpad error: EMV error',
-            -111545: 'Pinpad error: Cryptographic error',
-            -111546: 'Pinpad error: Communication error',
-            -111547: 'Pinpad error: Invalid firmware version',
-            -111548: 'Pinpad error: Printer is out of paper',
-            -111549: 'Pinpad error: Printer is overheated',
-            -111550: 'Pinpad error: Device is not connected',
-            -111551: 'Pinpad error: Use the chip reader',
-            -111552: 'Pinpad error: End the day first',
-            -111554: 'Pinpad error: Error from Borica',
-            -111555: 'Pinpad error: No connection with pinpad',
-            -111556: 'Pinpad error: Success in pinpad, unsuccess in ECR',
-            -111557: 'Pinpad error: Not configured connection between fiscal device and PinPad',
-            -111558: 'Pinpad error: The last transactions are equals or connection is interrupted - try again.',
-            -111559: 'Pinpad error: Payment type: debit/credit card via PinPad. '
-                     'In the fiscal receipt is allowed only one payment with such type.',
-            -111560: 'Pinpad error: Unknown result of the transaction between fiscal device and PinPad',
-            -111561: 'Pinpad error: Pinpad type not configured',
-            -111700: 'Pinpad error: Invalid ammount.',
-            -111701: 'Pinpad error: Transaction not found.',
-            -111702: 'Pinpad error: The file is empty.',
-            -111703: 'Entered cashback is bigger than cashback limit.',
-
-            -111800: 'ERR_SCALE_NOT_RESPOND',
-            -111801: 'ERR_SCALE_NOT_CALCULATED',
-            -111802: 'ERR_SCALE_WRONG_RESPONSE',
-            -111803: 'ERR_SCALE_ZERO_WEIGHT',
-            -111804: 'ERR_SCALE_NEGATIVE_WEIGHT',
-            -111805: 'ERR_SCALE_T_WRONG_INTF',
-            -111806: 'ERR_SCALE_T_CONNECT',
-            -111807: 'ERR_SCALE_SEND',
-            -111808: 'ERR_SCALE_RECEIVE',
-            -111809: 'ERR_SCALE_FILE_GENERATE',
-            -111810: 'ERR_SCALE_NOT_CONFIG',
-
-            -111900: 'Communication error wtih NTP server: Cannot make communication',
-            -111901: 'Communication error wtih NTP server: '
-                     'The date and time is earlier than the last saved in the fiscal memory',
-            -111902: 'Communication error wtih NTP server: Wrong IP address',
-
-            -112000: 'Fiscal printer error: Fiscal printer invalid command',
-            -112001: 'Fiscal printer error: Fiscal printer command invalid syntax',
-            -112002: 'Fiscal printer error: Command is not permitted',
-            -112003: 'Fiscal printer error: Register overflow',
-            -112004: 'Fiscal printer error: Wrong date/time',
-            -112005: 'Fiscal printer error: PC mode is needed',
-            -112006: 'Fiscal printer error: No paper',
-            -112007: 'Fiscal printer error: Cover is open',
-            -112008: 'Fiscal printer error: Printing mechanism error',
-
-            -112100: '_ERR_FP_SYNTAX_PARAM_BEGIN',
-            -112101: 'Invalid syntax of parameter 1.',
-            -112102: 'Invalid syntax of parameter 2.',
-            -112103: 'Invalid syntax of parameter 3.',
-            -112104: 'Invalid syntax of parameter 4.',
-            -112105: 'Invalid syntax of parameter 5.',
-            -112106: 'Invalid syntax of parameter 6.',
-            -112107: 'Invalid syntax of parameter 7.',
-            -112108: 'Invalid syntax of parameter 8.',
-            -112109: 'Invalid syntax of parameter 9.',
-            -112110: 'Invalid syntax of parameter 10.',
-            -112111: 'Invalid syntax of parameter 11.',
-            -112112: 'Invalid syntax of parameter 12.',
-            -112113: 'Invalid syntax of parameter 13.',
-            -112114: 'Invalid syntax of parameter 14.',
-            -112115: 'Invalid syntax of parameter 15.',
-            -112116: 'Invalid syntax of parameter 16.',
-            -112199: '_ERR_FP_SYNTAX_PARAM_END',
-
-            -112200: '_ERR_FP_BAD_PARAM_BEGIN',
-            -112201: 'Bad value of parameter 1.',
-            -112202: 'Bad value of parameter 2.',
-            -112203: 'Bad value of parameter 3.',
-            -112204: 'Bad value of parameter 4.',
-            -112205: 'Bad value of parameter 5.',
-            -112206: 'Bad value of parameter 6.',
-            -112207: 'Bad value of parameter 7.',
-            -112208: 'Bad value of parameter 8.',
-            -112209: 'Bad value of parameter 9.',
-            -112210: 'Bad value of parameter 10.',
-            -112211: 'Bad value of parameter 11.',
-            -112212: 'Bad value of parameter 12.',
-            -112213: 'Bad value of parameter 13.',
-            -112214: 'Bad value of parameter 14.',
-            -112215: 'Bad value of parameter 15.',
-            -112216: 'Bad value of parameter 16.',
-            -112299: '_ERR_FP_BAD_PARAM_END',
-
-            -113000: 'Flash memory error: Reading ID error',
-            -113001: 'Flash memory error: Sector size error',
-
-            -118000: 'ECR server error: The connection socket is not open',
-            -118001: 'ECR server error: The set for this command is not opened',
-            -118002: 'ECR server error: Wrong parameter',
-            -118003: 'ECR server error: Socket send error. Could not send data to server',
-            -118004: 'ECR server error: Receiving timeout. No data is receivec on time',
-            -118005: 'ECR server error: Socket is closed',
-            -118006: 'ECR server error: Unknown state',
-            -118007: 'ECR server error: Forbidden operation',
-
-            -120000: 'Programming: Name is not unique!',
-            -120001: 'Programming: Operator password is not unique!',
-            -120002: 'Programming: Date and time is under the range.',
-            -120003: 'Programming: Date and time is under the range.',
-
-            -121000: 'Barcode scanner reading error!',
-            -121001: 'Invalid EIK/EGN number!',
-
-            -170000: 'USB error: Host init error',
-            -170001: 'USB error: No device',
-            -170002: 'USB error: No filesystem',
-            -170003: 'USB error: File open error',
-            -170004: 'USB error: File copy error',
-
-        }
+    # Class attribute, one table shared by all devices
+    error_list = {
+        0: 'Operation successful.',
+        -1: 'General error / Unknown error.',
+        -2: 'Create error.',
+        -3: 'Open error',
+        -4: 'Close error',
+        -5: 'Device or resource busy.',
+        -6: 'Timeout expired.',
+        -7: 'The operation is not supported.',
+        -8: 'Memory allocation error.',
+        -9: 'Invalid parameter.',
+        -10: 'Input/Output error',
+        -11: 'CRC error.',
+        -12: 'Flash memory error.',
+        -13: 'EEPROM error',
+        -14: 'Device error.',
+        -15: 'The operation is not implemented.',
+        -16: 'The device or resource does not exists.',
+        -17: 'Invalid command.',
+        -18: 'Not exist object.',
+        -19: 'No more items or operations',
+        -20: 'Command failed',
+        -21: 'Invalid command',
+        -22: 'No registered',
+        -23: 'Some bits in the status bytes of the fiscal device was raised.',
+        -24: 'Trial period has expired.',
+        -25: 'The functionality of your product is time limited. Please contact the support team!',
+
+        -40: 'Device communication exceptions, check if the device is on.',
+        -41: 'Device communication exceptions, check if the device is on.',
+        -42: 'Device communication exceptions, check if the device is on.',
+        -43: 'Device communication exceptions, check if the device is on.',
+        -44: 'Device communication exceptions, check if the device is on.',
+        -45: 'Device communication exceptions, check if the device is on.',
+        -46: 'Device communication exceptions, check if the device is on.',
+        -50: 'The printer is out of paper.',
+        -51: 'General/syntax error',
+
+        -52: 'Incorrect command number in the string',
+        -53: 'Opened fiscal receipt, command not allowed',
+        -54: 'Opened nonfiscal receipt, command not allowed',
+        -55: 'No opened receipt, command not allowed',
+        -56: 'Fiscal memory full ',
+        -57: 'Fiscal memory error (read/write failed/corrupt, memory in read-only state or last entry is corrupt)',
+        -58: 'Command cannot be executed in current fiscal mode ',
+        -59: 'Ram reset after powering the device',
+        -60: 'Incoming data has syntax error or wrong command number',
+        -61: 'Failure in the printing mechanism',
+        -62: 'Fiscal memory is in read only mode',
+        -63: 'Tax terminal not responding',
+        -64: 'Electronic journal is full',
+        -201: 'Class exceptions due to wrong parameters/bugs',
+        -202: 'Class exceptions due to wrong parameters/bugs',
+        -203: 'Class exceptions due to wrong parameters/bugs',
+        -204: 'Class exceptions due to wrong parameters/bugs',
+        -205: 'Class exceptions due to wrong parameters/bugs',
+        -206: 'Class exceptions due to wrong parameters/bugs',
+        -207: 'Class exceptions due to wrong parameters/bugs',
+        -208: 'Class exceptions due to wrong parameters/bugs',
+        -209: 'Class exceptions due to wrong parameters/bugs',
+        -210: 'Class exceptions due to wrong parameters/bugs',
+        -221: 'Class exceptions due to wrong parameters/bugs',
+        -222: 'Class exceptions due to wrong parameters/bugs',
+        -223: 'Class exceptions due to wrong parameters/bugs',
+        -224: 'Class exceptions due to wrong parameters/bugs',
+        -225: 'Class exceptions due to wrong parameters/bugs',
+        -226: 'Class exceptions due to wrong parameters/bugs',
+        -227: 'Class exceptions due to wrong parameters/bugs',
+        -228: 'Class exceptions due to wrong parameters/bugs',
+        -229: 'Class exceptions due to wrong parameters/bugs',
+        -220: 'Class exceptions due to wrong parameters/bugs',
+
+        -10000: 'Wrong logical number, check your string or file',
+        -10001: 'Function ''EXECUTE_FILE'' - execute file does not exist',
+        -10002: 'Function ''EXECUTE_FILE'' - wrong file format.',
+        -10003: 'Function ''OPEN_TCPIP'' - wrong IP address string',
+
+        -5000: 'Exception in "OPEN_PORT" function - check your parameters',
+        -5001: 'Exception in "EXECUTE_STRING" function - check your parameters',
+        -5002: 'Exception in "EXECUTE_FILE" function - check your parameters',
+        -5003: 'Exception in "CLOSE_PORT" function ',
+        -5004: 'Exception in "GET_SERIAL_NUMBER'' function  - check your parameters',
+        -5005: 'Exception in "GET_SERIAL_NUMBER_TCPIP'' function  - check your parameters',
+        -5006: 'Exception in "OPEN_TCPIP" function - check your parameters',
+        -5007: 'Exception in "CLOSE_TCPIP" function ',
+
+        -10500: 'Missing input parameter. [INPUT]',
+        -10502: 'Check for exceeding the upper limit of the parameter (length). [INPUT]',
+        -10503: 'Check for exceeding the lower limit of the parameter (length). [INPUT]',
+        -10504: 'Check for availability in the enumerated list of values. [INPUT]',
+        -10505: 'Check whether the parameter is real number. [INPUT]',
+        -10506: 'Check for exceeding the upper limit of the parameter (Currency value). [INPUT]',
+        -10507: 'Check for exceeding the lower limit of the parameter (Currency value). [INPUT]',
+        -10508: 'Check for exceeding the upper limit of the parameter (QTY value). [INPUT]',
+        -10509: 'Check for exceeding the lower limit of the parameter (QTY value). [INPUT]',
+        -10510: 'Check whether the parameter is an integer value. [INPUT]',
+        -10511: 'Check for exceeding the upper limit of the parameter (INT value). [INPUT]',
+        -10512: 'Check for exceeding the lower limit of the parameter (INT value). [INPUT]',
+        -10513: 'Check for exceeding the upper limit of the parameter (length). [OUTPUT]',
+        -10514: 'Check for exceeding the lower limit of the parameter (length). [OUTPUT]',
+        -10515: 'Check for availability in the enumerated list of values. [OUTPUT]',
+        -10516: 'Check whether the parameter is real number. [OUTPTUT]',
+        -10517: 'Check for exceeding the upper limit of the parameter (Currency value). [OUTPUT]',
+        -10518: 'Check for exceeding the lower limit of the parameter (Currency value). [OUTPUT]',
+        -10519: 'Check for exceeding the upper limit of the parameter (QTY value). [OUTPUT]',
+        -10520: 'Check for exceeding the lower limit of the parameter (QTY value). [OUTPUT]',
+        -10521: 'Check whether the parameter is an integer value. [OUTPUT]',
+        -10522: 'Check for exceeding the upper limit of the parameter (INT value). [OUTPUT]',
+        -10523: 'Check for exceeding the lower limit of the parameter (INT value). [OUTPUT]',
+        -10524: 'Missing output parameter. [OUTPUT]',
+        -10525: 'Timeout error.',
+        -10526: 'Command not found.(By name)',
+        -10527: 'Command not found.(By values)',
+        -10528: 'Successfully canceled PinPad transaction (automatically  - from settings)',
+        -10529: 'The CSV file is not in format (";";";)',
+        -10530: 'This is a header row.',
+
+        -16500: 'The communication thread is not started yet.',
+        -16501: 'The communication thread is busy - execution of the command.',
+        -16502: 'The communication thread is busy - waiting for answer.',
+        -16503: 'The communication thread is busy - waiting for pinpad event.',
+        -16504: 'The communication thread is busy - communication with a Borika server.',
+        -16505: 'Unknown status - general error.',
+        -16506: 'Received an unknown sub event value.',
+        -16507: 'Received an unknown event value. Unknown or wrong protocol.',
+        -16508: 'Unsupported socket ID. Wrong protocol.',
+        -16509: 'Unsupported socket value for "TYPE". Wrong protocol.',
+        -16510: 'The program can''t connect to server.',
+        -16511: 'The tags list is empty.',
+        -16512: 'Wrong protocol - readByte method:(missing  $3E  byte).',
+        -16513: 'Wrong protocol - readByte method:(missing event delimiter [$00]  byte).',
+        -16514: 'Wrong protocol - readByte method:(missing byte for answer type determination).',
+        -16515: 'Wrong protocol - readByte method:(missing status byte).',
+        -16516: 'Internal error - cannot make a transaction.',
+        -16517: 'Internal error - cannot find the transaction.',
+
+        -23000: 'No internet connection.',
+        -23001: 'Client can not connect to the server.',
+        -23002: 'Client can not register calback.',
+        -23003: 'Client can not disconnect properly from the server.',
+        -23004: 'Client can not get user table from the server.',
+        -23005: 'Client can not clear old transactions from the server.',
+        -23006: 'Client can not broadcast the message.',
+        -23007: 'Client can not execute update method (2).',
+
+        -33000: 'Load from to failed.',
+        -33001: 'Save to file failed',
+        -33002: 'Wrong protocol - readByte method:(missing SOH byte)',
+        -33003: 'Wrong protocol - readByte method:(missing SEQ byte).',
+        -33004: 'Wrong protocol - readByte method:(missing EOT byte)',
+        -33005: 'Wrong protocol - readByte method:(missing ENQ byte)',
+        -33006: 'Wrong protocol - readByte method:(missing BCC byte)',
+        -33007: 'Wrong protocol - readByte method:(missing ETX byte)',
+        -33008: 'Error due parsing. Something is wrong in the script line.',
+        -33009: 'The script is empty.',
+        -33010: 'The script execution was interrupted by user.',
+        -33011: 'Duplicate label',
+        -33012: 'Invalid parameter value',
+        -33013: 'FiscalDevice component is not assigned to scrypt engine.',
+        -33014: 'Misc component is not assigned to scrypt engine.',
+        -33015: 'The index is out of range. The value is greater than numbers of the fields in the answer.',
+        -33016: 'Misc component not assigned.',
+        -33017: 'Error container component not assigned.',
+        -33018: 'Description container component not assigned.',
+        -33019: 'Connector component not assigned.',
+        -33020: 'Device depended method is not prepared.',
+        -33021: 'Fiscal device component not assigned',
+        -33022: 'Device not connected',
+        -33023: 'Device is connected - you can not change these values until the device is still connected.',
+        -33024: 'Invalid file name.',
+        -33025: 'Unknown device model',
+        -33026: 'Transport protocol not supported.',
+        -33027: 'Not supported script engine',
+        -33028: 'Device answer is not by its protocol.',
+        -33029: 'No files for download',
+        -33030: 'Delete file - access denied.',
+        -33031: 'The operation is canceled by user.',
+        -33032: 'Incorrect checksum',
+        -33033: 'Empty stamp name.',
+        -33034: 'The stamp name length must be <= 12 symbols.',
+        -33035: 'Invalid command name.',
+        -33036: 'Invalid param index.',
+        -33037: 'Invalid param name.',
+        -33038: 'Command not found.',
+        -33039: 'Invalid enumerate list index.',
+        -33040: 'No input params for this command.',
+        -33041: 'Param not found.',
+        -33042: 'No output params - general error.',
+        -33043: 'The COM Server not assigned.',
+        -33044: 'Unsupported document type. Use other method for this type!',
+        -33045: 'Sniffer component not assigned.',
+        -33046: 'Connection is not active',
+        -33047: 'File: Access denied',
+        -33048: 'Transaction Header not found.',
+        -33049: 'The header status for this transaction is not in proper state for this operation.',
+        -33050: 'Not all items for this transaction are prepared.',
+        -33051: 'Headers list is empty.',
+        -33052: 'The status of the transaction is still "executing".',
+        -33053: 'The script item status is not in proper state for this operation.',
+        -33054: 'One or more of the script items contain a wrong value.',
+        -33055: 'Common logical error: answer',
+        -33056: 'The transaction queue engine reject the command',
+        -33057: 'The transaction queue engine can not delete an old transaction.',
+        -33058: 'The script item is not found.',
+        -33059: 'The header item is not found.',
+        -33060: 'The errors list is empty.',
+        -33061: 'The error item is not found. Please check the value of ID!',
+        -33062: 'You have not enough rights to do this operation.',
+
+        -100000: 'Function ''OPEN_PORT'' – the serial key is wrong',
+
+        #  Firmware errors Group 'A'
+        - 150001: 'Syntax error',
+        -150002: 'Invalid command ',
+        -150003: 'Not permited ',
+        -1500010: 'Printer is blocked',
+
+        -150100: 'Clock not set ',
+        -150101: 'Out of paper ',
+        -150102: 'Journal error ',
+        -150103: 'Arithmetic overflow ',
+        -150104: 'Invalid password ',
+        -150105: 'Less than 2 lines in header ',
+        -150106: 'Invalid serial number ',
+        -150107: 'Invalid bar code data ',
+        -150108: 'Invalid request ',
+        -150109: 'Cutter error ',
+        -150110: 'Presenter error ',
+        -150111: 'Data contain FISCAL',
+        -150112: 'Wrong invoice number ',
+        -150113: 'UNP missing ',
+        -150114: 'UNP counter overflow ',
+        -150115: 'UNP must increase',
+        -150116: 'Not logged in',
+        -150117: 'Currency not defined',
+
+        -150200: 'Receipt is open',
+        -150201: 'No receipt is open',
+        -150202: 'Receipts after Z-report',
+        -150203: 'No receipts after Z-report',
+        -150204: 'More than 24 hours without Z-report',
+        -150205: 'Date and time before last FM record',
+        -150206: 'Date and time before last JNL record',
+        -150207: 'Probably wrong date and time',
+        -150208: 'Not in service mode',
+        -150209: 'Cannot read from el. journal',
+        -150210: 'Cannot write to el. journal',
+        -150211: 'Cannot format el. journal',
+        -150212: 'Cannot open el. journal document',
+        -150213: 'No access to external display',
+        -150214: 'Journal near end',
+        -150215: 'Cannot format valid el. journal',
+        -150216: 'El. journal number too big',
+        -150217: 'No data for document found',
+        -150218: 'Journal paper width different ',
+        -150231: 'Journal buffer full ',
+        -150232: 'Journal buffer write failed',
+
+        -150300: 'Fiscal memory not formatted',
+        -150301: 'Serial number not set',
+        -150302: 'VAT number not set',
+        -150303: 'VAT rates not set',
+        -150304: 'All VAT rates disabled',
+        -150305: 'Printer is not fiscalized',
+        -150306: 'Printer is fiscalized',
+        -150307: 'No records in fiscal memory',
+        -150308: 'Fiscal memory not responding',
+        -150309: 'Too many records in fiscal memory',
+        -150310: 'Serial number already set',
+        -150311: 'Fiscal memory is read only',
+        -150312: 'Fiscal memory not found',
+        -150313: 'Fiscal memory read error',
+        -150314: 'VAT rates or decimals changed',
+
+        -150400: 'PLU does not exist ',
+        -150401: 'Department does not exist ',
+        -150402: 'Invalid VAT group ',
+        -150403: 'VAT group is disabled ',
+        -150404: 'Too many sales in receipt ',
+        -150405: 'Payment or discount/mark up done ',
+        -150406: 'Negative sum or quantity ',
+        -150407: 'Discount larger than price ',
+        -150408: 'Void of non-existing sale ',
+        -150409: 'Payment is started ',
+        -150410: 'Payment type not programmed ',
+        -150411: 'Total is already paid ',
+        -150412: 'Total is not entirely paid ',
+        -150413: 'Not enough cash available ',
+        -150414: 'Cash payment only ',
+        -150415: 'Change not allowed ',
+        -150416: 'Non-zero sum for this operator ',
+        -150417: 'Non-zero sum for this PLU ',
+        -150418: 'Non-zero sum for this department ',
+        -150419: 'No free PLUs for programming ',
+        -150420: 'Too many lines in receipt ',
+        -150421: 'No receipt copy data ',
+        -150422: 'Non-zero sum for this payment type ',
+        -150423: 'PLU is sold in this receipt ',
+        -150424: 'Invalid fuel PLU ',
+        -150425: 'Fuels may be sold using PLU only ',
+        -150426: 'Not gas station ',
+        -150427: 'More than 200 departments with sales ',
+        -150428: 'No data for receipt copy ',
+        -150429: 'Fuel storno not allowed ',
+        -150430: 'Invalid storno date and time ',
+        -150431: 'Zero price ',
+        -150432: 'Too many fuel sales in receipt ',
+        -150433: 'Already paid non-cash ',
+        -150434: 'Payment transaction denied',
+        -150435: 'Non-zero sums',
+        -150436: 'No tip allowed',
+
+        -150800: 'Printer is not registered ',
+        -150801: 'No invoice number ',
+        -150802: 'Invoice number outside interval ',
+        -150803: 'No invoice numbers interval programmed ',
+        -150804: 'No customer data entered ',
+        -150805: 'Customer data already entered ',
+        -150806: 'Not an invoice ',
+        -150807: 'Tax terminal error ',
+        -150808: 'GPRS-modem not responding ',
+        -150809: 'GPRS-modem busy ',
+        -150810: 'No SIM-card in modem ',
+        -150811: 'SIM-card different from registered one ',
+        -150812: 'Outdated petrol station info ',
+        -150813: 'No starting data command ',
+        -150814: 'Not crypted firmware ',
+        -150815: 'Firmware too big ',
+        -150816: 'Start command B needed ',
+        -150817: 'End command  E needed ',
+        -150818: 'XML line too long ',
+        -150819: 'This is an invoice ',
+
+        #  Firmware errors Group B
+        -100001: 'General error in fiscal device: In - out error( cannot read or write )',
+        -100002: 'General error in fiscal device: Wrong checksum',
+        -100003: 'General error in fiscal device: No more data',
+        -100004: 'General error in fiscal device: The element is not found',
+        -100005: 'General error in fiscal device: There are no records found',
+        -100006: 'General error in fiscal device: The operation is aborted',
+        -100007: 'Wrong mode( standart, training...)  is selected.',
+        -100008: 'General error in fiscal device: Device is not ready',
+        -100009: 'General error in fiscal device: Nothing to print',
+
+        -100100: 'Fiscal memory error: Fiscal memory is busy',
+        -100101: 'Fiscal memory error: Fiscal memory failure. Could not read or write',
+        -100102: 'Fiscal memory error: Forbidden write in fiscal memory',
+        -100103: 'Fiscal memory error: Wrong address in fiscal memory',
+        -100104: 'Fiscal memory error: Wrong size in fiscal memory',
+        -100105: 'Fiscal memory error: Fiscal memory is not connected',
+        -100106: 'Fiscal memory error: Wrong checksum in fiscal memory( invalid data )',
+        -100107: 'Fiscal memory error: Empty block in fiscal memory',
+        -100108: 'Fiscal memory error: Maximum number of block  in fiscal memory',
+        -100109: 'Fiscal memory error: Wrong range in fiscal memory',
+        -100110: 'Fiscal memory error: Empty range in fiscal memory',
+        -100111: 'Fiscal memory error: New module in fiscal memory',
+        -100112: 'Fiscal memory error: Fiscal memory is not empty',
+        -100113: 'Fiscal memory error: Fiscal memory is not equal',
+        -100114: 'Fiscal memory error: Fiscal memory is full',
+        -100115: 'Fiscal memory error: Fiscal memory needs update',
+        -100116: 'Fiscal memory error: Fiscal memory is blocked',
+
+        -100400: 'Line thermal printer mechanism error: Power supply error ( 3,3 V )',
+        -100401: 'Line thermal printer mechanism error: Power supply error ( 24V or 8V )',
+        -100402: 'Line thermal printer mechanism error: Head overheating',
+        -100403: 'Line thermal printer mechanism error: Paper end',
+        -100404: 'Line thermal printer mechanism error: Cover is open',
+        -100405: 'Line thermal printer mechanism error: Near paper end',
+        -100406: 'Line thermal printer mechanism error: Mark sensor - not used',
+        -100407: 'Line thermal printer mechanism error: Cutter error',
+        -100414: 'Printer on time is overrun.',
+
+        -100500: 'System error: Memory structure error',
+        -100501: 'System error: Error in RAM',
+        -100502: 'System error: Flash memory error',
+        -100503: 'System error: SD card error',
+        -100504: 'System error: Invalid message file',
+        -100505: 'System error: Fiscal memory error( could not write or read )',
+        -100506: 'System error: No RAM battery',
+        -100508: 'System error: Real time clock error',
+        -100509: 'System error: Memory error',
+
+        -101000: 'Common logical error: No heap memory( cannot allocate memory for operation )',
+        -101001: 'Common logical error: File manipulate error',
+        -101003: 'Common logical error: Operation is rejected',
+        -101004: 'Common logical error: Bad input. Some of the data or parameters are incorrect',
+        -101005: 'Common logical error: In Application Programming error',
+        -101006: 'Common logical error: The execution of the operation is not possible',
+        -101007: 'Common logical error: Timeout. The time for waiting execution is out',
+        -101007: 'Common logical error: Timeout. The time for waiting execution is out',
+        -101008: 'Common logical error: Invalid time',
+        -101009: 'Common logical error: The operation is cancelled',
+        -101010: 'Common logical error: Invalid format',
+        -101011: 'Common logical error: Invalid data',
+        -101012: 'Common logical error: Data parsing error',
+        -101013: 'Common logical error: Hardware configuration error',
+        -101014: 'Common logical error: Access denied',
+        -101015: 'Wrong data length',
+        -101016: 'Error during verification of Z reports',
+        -101017: 'Common logical error:  No permission',
+
+        -102000: 'Battery error: Low battery',
+        -102001: 'Battery error: Low battery warning',
+        -102002: 'Operator error: Wrong operator password',
+        -102003: 'ECR error: ID number is empty',
+        -102004: 'Bluetooth error: Bluetooth is not found',
+        -102005: 'Display error: Display is not connected',
+        -102006: 'Printer error: Printer is not connected',
+        -102007: 'SD card error: SD card not present',
+        -102008: 'SD card error: SD2 card not present',
+        -102009: 'ECR error: VAT rates is not set.',
+        -102010: 'ECR error: Header lines are empty.',
+        -102011: 'User is registered by VAT, but number of the user is not entered.',
+        -102012: 'ECR error: FM number is empty',
+        -102013: 'ECR error: Serviceman name is empty',
+        -102014: 'ECR error: Serviceman ID is empty',
+        -102015: 'ECR error: Tax office ID is empty!',
+        -102016: 'ECR error: Wrong format',
+        -102017: 'ECR error: TAX number is empty',
+        -102018: 'ECR error: ID number is wrong',
+        -102019: 'ECR error: Date and time are earlier than date and time of previous Z report.',
+        -102020: 'ECR error: The software password is not entered',
+
+        -103000: 'PLU database error: PLU database is not found',
+        -103001: 'PLU database error: PLU code already exists',
+        -103002: 'PLU database error: Barcode already exists',
+        -103003: 'PLU database error: PLU database is full',
+        -103004: 'PLU database error: PLU has turnover',
+        -103005: 'PLU database error: In the PLU base has an article with same name.',
+        -103006: 'PLU database error: PLU name is not unique.',
+        -103007: 'PLU database error: Database format is not compatible.',
+        -103008: 'PLU database error: Can''t open the PLU database file',
+
+        - 104000: 'Service operation error: Z report is needed for this operation',
+        -104001: 'Service operation error: Service jumper is needed for this operation',
+        -104002: 'Service operation error: Service password is needed for this operation',
+        -104003: 'Service operation error: The operation is forbidden',
+        -104004: 'Service operation error: Service intervention is needed',
+        -104005: 'Service operation error: All clearing report is needed.',
+        -104006: 'Service operation error: Z report closed.',
+        -104007: 'Service operation error: Montly report needed.',
+        -104008: 'Service operation error: Year report needed.',
+        -104009: 'Service operation error: Backup needed.',
+        -104011: 'Clearing report for operator is needed.',
+        -104012: 'Clearing report for item group is needed.',
+        -104013: 'VAT changes is needed.',
+
+        -105000: 'EJ error: No records in EJ',
+        -105001: 'EJ error: Cannot add to EJ',
+        -105003: 'EJ error: Signature key version is changed -> impossible check',
+        -105004: 'EJ error: Bad record in EJ',
+        -105005: 'EJ error: Generate signature error( cannoct generate signature )',
+        -105006: 'EJ error: Wrong type of document to sign',
+        -105007: 'EJ error: Document is already signed',
+        -105008: 'EJ error: EJ is not from this device',
+        -105009: 'EJ error: EJ is almost full',
+        -105010: 'EJ error: EJ is full',
+        -105011: 'EJ error: Wrong format of EJ',
+        -105012: 'The electronic journal is not ready.',
+        -105013: 'Error in EJ structure. Create new one.',
+
+        -106000: 'Client database error: Firm does not exist',
+        -106001: 'Client database error: Firmcode already exists',
+        -106002: 'Client database error: EIK already exists',
+        -106003: 'Client database error: Firm database is full',
+        -106004: 'Client database error: Firm database is not found',
+
+        -108000: 'Discount card database error: Discount card does not exist',
+        -108001: 'Discount card database error: Discount card already exists',
+        -108002: 'Discount card database error: Barcode already exists',
+        -108003: 'Discount card database error: Discount card database is full',
+        -108004: 'Discount card database error: Discount card not found',
+
+        -110100: 'Device error: Communication error',
+        -110101: 'Device error: Wrong struct format',
+        -110102: 'Device error: ST flag is active',
+        -110103: 'Device error: Invalid data',
+        -110104: 'Device error: Device is not fiscalized',
+        -110105: 'Device error: Device is already fiscalized',
+        -110106: 'Device error: Device is in service mode',
+        -110107: 'Device error: Service date is passed',
+        -110108: 'Device error: Day( shift ) is open',
+        -110109: 'Device error: Day( shift ) is closed',
+        -110110: 'Device error: Z-report number and shift number are not equal',
+        -110111: 'Device error: Only admin has permition',
+        -110112: 'Device error: Fiscal memory is closed',
+
+        -110200: 'NAP server error: Error open session',
+        -110201: 'NAP server error: Error preparing data for server',
+        -110202: 'NAP server error: There is unsent data',
+        -110203: 'NAP server error: Receiving data error',
+        -110204: 'NAP server error: Empty data',
+        -110205: 'NAP server error: Server negative answer',
+        -110206: 'NAP server error: Wrong answer format',
+        -110208: 'NAP server error: Server exception',
+        -110209: 'NAP server error: Not registered on server',
+        -110209: 'NAP server error: Not registered on server',
+        -110210: 'NAP server error: Communication with NAP server is blocked',
+        -110211: 'NAP server error: Modem error',
+        -110212: 'NAP server error: NAP is busy',
+        -110213: 'NAP server error: Already registered',
+        -110214: 'NAP server error: Wrong PS type',
+        -110215: 'NAP server error: Deregistered in NAP',
+        -110216: 'NAP server error: Wrong IMSI number',
+        -110217: 'NAP server error: Device is blocked( maximum Z-reports )',
+        -110218: 'NAP server error: Wrong FD( Fiscal device ) type',
+        -110219: 'NAP server error: The ECR is blocked by server',
+        -110220: 'NAP server error: The ECR is blocked - server error',
+        -110221: 'NAP server error: No server address',
+        -110222: 'NAP server error: Max. registrations reached.',
+        -110225: 'NAP server error: Device is blocked( unsent sales documents )',
+        -110226: 'NAP server error: Communication with NAP server is blocked. '
+                 'More than 24 hours from last sent receipt.',
+
+        -110300: 'Working error: Invalid file',
+        -110301: 'Working error: Invalid parameters',
+
+        -110400: 'Connection error: Connection init error',
+        -110401: 'NRA connection error: Wrong parameteres',
+        -110402: 'NRA connection error: No GPRS',
+        -110403: 'Connection error: Failed to initialize connection with NRA Repository Server',
+        -110404: 'Connection error: Wrong answer format',
+        -110405: 'Connection error: Wrong configuration',
+        -110420: 'NRA server returns error',
+        -110481: 'Error in answer from NRA server on parameter 1',
+        -110482: 'Error in answer from NRA server on parameter 2',
+        -110483: 'Error in answer from NRA server on parameter 3',
+        -110484: 'Error in answer from NRA server on parameter 4',
+        -110485: 'Error in answer from NRA server on parameter 5',
+        -110486: 'Error in answer from NRA server on parameter 6',
+        -110487: 'Error in answer from NRA server on parameter 7',
+        -110488: 'Error in answer from NRA server on parameter 8',
+        -110489: 'Error in answer from NRA server on parameter 9',
+        -110490: 'Error in answer from NRA server on parameter 10',
+        -110491: 'Error in answer from NRA server on parameter 11',
+        -110492: 'Error in answer from NRA server on parameter 12',
+        -110493: 'Error in answer from NRA server on parameter 13',
+        -110494: 'Error in answer from NRA server on parameter 14',
+        -110495: 'Error in answer from NRA server on parameter 15',
+        -110496: 'Error in answer from NRA server on parameter 16',
+
+        -110500: 'Modem error: error in communication between device and modem',
+        -110501: 'Modem error: No SIM card',
+        -110502: 'Modem error: Wrong PIN of SIM',
+        -110503: 'Modem error: Cannot register to mobile network',
+        -110504: 'Modem error: No PPP connection( cannot connect )',
+        -110505: 'Modem error: Wrong modem configuration( for example - no programmed apn )',
+        -110506: 'Modem error: Modem initializing',
+        -110507: 'Modem error: Modem is not ready',
+        -110508: 'Modem error: Remove SIM card',
+        -110509: 'Modem error: Modem found a cell',
+        -110510: 'Modem error: Modem does not find a cell',
+        -110511: 'Modem error: Failed lot days',
+
+        -110601: 'Modem error: Device is not connected to AP( access point )',
+
+        -110700: 'Network error: Cannot resolve address',
+        -110701: 'Network error: Cannot open socket for communication with server',
+        -110702: 'Network error: Connection error( cannot connect to a server )',
+        -110703: 'Network error: Config error( for example: no server address )',
+        -110704: 'Network error: Connection socket is already opened',
+        -110705: 'Network error: SSL communication error( something went wrong in cryptographic protocol )',
+        -110706: 'Network error: HTTP communication error( something went wrong in http protocol )',
+
+        -110800: 'Tax terminal error: No error',
+        -110801: 'Tax terminal error: Unknown ID',
+        -110802: 'Tax terminal error: Invalid token( key from the server )',
+        -110803: 'Tax terminal error: Protocol error',
+        -110804: 'Tax terminal error: The command is unknown',
+        -110805: 'Tax terminal error: The command is not supported',
+        -110806: 'Tax terminal error: Invalid configuration',
+        -110807: 'Tax terminal error: SSL is not allowed',
+        -110808: 'Tax terminal error: Invalid request number',
+        -110809: 'Tax terminal error: Invalid retry request',
+        -110810: 'Tax terminal error: Cannot cancel ticket',
+        -110811: 'Tax terminal error: More than 24 hours from shift opening',
+        -110812: 'Tax terminal error: Invalid login name or password',
+        -110813: 'Tax terminal error: Incorrect request data',
+        -110814: 'Tax terminal error: Not enough cash',
+        -110815: 'Tax terminal error: Blocked from server',
+        -110854: 'Tax terminal error: Service temporarily unavailable',
+        -110855: 'Tax terminal error: Unknown error',
+
+        -111000: 'Registration mode error: Common error, followed by deliting all data for the command',
+        -111001: 'Registration mode error: Common error, followed by partly deliting data for the command',
+        -111002: 'Registration mode error: Syntax error. Check the parameters of the command',
+        -111003: 'Registration mode error: Cannot do operation',
+        -111004: 'Registration mode error: PLU code was not found',
+        -111005: 'Registration mode error: Forbidden VAT',
+        -111006: 'Registration mode error: Overflow in multiplication of quantity and price',
+        -111007: 'Registration mode error: PLU has no price',
+        -111008: 'Registration mode error: Group is not in range',
+        -111009: 'Registration mode error: Department is not in range',
+        -111010: 'Registration mode error: BAR code does not exist',
+        -111011: 'Registration mode error: Overflow of the PLU turnover',
+        -111012: 'Registration mode error: Overflow of the PLU quantity',
+        -111013: 'Registration mode error: ECR daily registers overflow',
+        -111014: 'Registration mode error: Bill total register overflow',
+        -111015: 'Registration mode error: Receipt is opened',
+        -111016: 'Registration mode error: Receipt is closed',
+        -111017: 'Registration mode error: No cash in ECR',
+        -111018: 'Registration mode error: Payment is initiated',
+        -111019: 'Registration mode error: Maximum number of sales in receipt',
+        -111020: 'Registration mode error: No transactions',
+        -111021: 'Registration mode error: Possible negative turnover',
+        -111022: 'Registration mode error: Foreign payment has change',
+        -111023: 'Registration mode error: Transaction is not found in the receipt',
+        -111024: 'Registration mode error: End of 24 hour blocking',
+        -111025: 'Registration mode error: Invalid invoice range',
+        -111026: 'Registration mode error: Operation is cancelled by operator',
+        -111027: 'Registration mode error: Operation approved by POS',
+        -111028: 'Registration mode error: Operation is not approved by POS',
+        -111029: 'Registration mode error: POS terminal communication error',
+        -111030: 'Registration mode error: Multiplication of quantity and price is 0',
+        -111031: 'Registration mode error: Value is too big',
+        -111032: 'Registration mode error: Value is bad',
+        -111033: 'Registration mode error: Price is too big',
+        -111034: 'Registration mode error: Price is bad',
+        -111035: 'Registration mode error: Operation all void is selected to be executed',
+        -111036: 'Registration mode error: Only all void operation is permitted',
+        -111040: 'Registration mode error: Restaurant: There is no free space for other purchases',
+        -111041: 'Registration mode error: Restaurant: There is no free space for new acount',
+        -111042: 'Registration mode error: Restaurant: Account is already opened',
+        -111043: 'Registration mode error: Restaurant: Wrong index',
+        -111044: 'Registration mode error: Restaurant: Account is not found',
+        -111045: 'Registration mode error: Restaurant: Not permitted( only for admins )',
+        -111046: 'Registration mode error: non-fiscal receipt is opened',
+        -111047: 'Registration mode error: fiscal receipt is opened',
+        -111048: 'Registration mode error: Buyers TIN is already entered',
+        -111049: 'Registration mode error: Buyers TIN is not entered',
+        -111050: 'Registration mode error: Payment is not initiated',
+        -111051: 'Registration mode error: Receipt type mismatch',
+        -111052: 'Registration mode error: Receipt total limit is reached',
+        -111053: 'Registration mode error: Sum cannot be divided by the minimum coin',
+        -111054: 'Registration mode error: Sum must be <= payment amount',
+        -111055: 'Registration mode error: Sum of voucher must be entered when paying with voucher',
+        -111056: 'Registration mode error: Total must be done when paying with voucher and sum > total',
+        -111057: 'Registration mode error: Payment with foreign currency is disabled',
+        -111058: 'Registration mode error: Payment with foreign currency is impossible',
+        -111059: 'Registration mode error: Sum must be bigger or equal to payment amount',
+        -111060: 'Registration mode error: Safe opening is disabled',
+        -111061: 'Registration mode error: Forbidden payment',
+        -111062: 'Registration mode error: Forbidden key for surcharge/discount',
+        -111063: 'Registration mode error: Entered sum is bigger than receipt sum',
+        -111064: 'Registration mode error: Entered sum is smaller than receipt sum',
+        -111065: 'Registration mode error: Fiscal printer: Sum of receipt is 0.',
+        -111066: 'Registration mode error: Fiscal printer: Operation VOID is executed. Close receipt is needed',
+        -111067: 'Registration mode error: Storno receipt is opened',
+        -111068: 'Registration mode error: Sum is not entered',
+        -111069: 'Registration mode error: Price type is invalid',
+        -111070: 'Registration mode error: Linked surcharge is forbidden',
+        -111071: 'Registration mode error: Negative price is forbidden',
+        -111072: 'Registration mode error: More than 1 VAT in one receipt is not allowed',
+        -111073: 'Registration mode error: Pinpad error',
+        -111074: 'Registration mode error: Buyer data is wrong',
+        -111075: 'Registration mode error: Vat system disable.',
+        -111076: 'Operator not logged in.',
+        -111077: 'The receipt date is early on last date in fiscal memory.',
+        -111078: 'Correction receipt data is not entered!',
+        -111079: 'Fractional quantity!',
+        -111080: 'Registration mode error: Registration mode error: Out of stock',
+        -111081: 'Registration mode error: Must pushing of the STL before TL.',
+        -111082: 'Package does not exist',
+        -111083: 'Measuring unit not found',
+        -111084: 'Category not found in the data base',
+        -111085: 'Invalid department name',
+        -111086: 'Bank terminal not configured',
+        -111089: 'Entered price is bigger than the programmed',
+        -111090: 'Fix PLU''s price',
+        - 111091: 'Incorect sign agent.',
+        -111092: 'Voucher payment cannot have change',
+        -111093: 'Sum for advance payment is bigger than the sum of article',
+        -111094: 'Payment in storno can not have change',
+        -111095: 'Invalid parameter - PLU is not defined as excise PLU',
+        -111096: 'Excise stamp of an excise PLU is not entered',
+        -111097: 'SALE FORBIDDEN (excise stamp is not valid)',
+
+        -111500: 'Pinpad error: No error from pinpad',
+        -111501: 'Pinpad error: General unicreditbulbank icon error',
+        -111502: 'Pinpad error: Not valid command or sub command code',
+        -111503: 'Pinpad error: Invalid parameter',
+        -111504: 'Pinpad error: The address is outside limits',
+        -111505: 'Pinpad error: The value is outside limits',
+        -111506: 'Pinpad error: The length is outside limits',
+        -111507: 'Pinpad error: The action is not permited in current state',
+        -111508: 'Pinpad error: There is no data to be returned',
+        -111509: 'Pinpad error: Timeout occurs',
+        -111510: 'Pinpad error: Invalid key number',
+        -111511: 'Pinpad error: Invalid key attributes(usage)',
+        -111512: 'Pinpad error: Calling of non-existing device',
+        -111513: 'Pinpad error: (Not used in this FW version)',
+        -111514: 'Pinpad error: Pin entering limit exceed',
+        -111515: 'Pinpad error: General error in flash commands',
+        -111516: 'Pinpad error: General hardware unicreditbulbank error',
+        -111517: 'Pinpad error: Invalid code check (Not used in this FW version)',
+        -111518: 'Pinpad error: The button CANCEL is pressed',
+        -111519: 'Pinpad error: Invalid signature',
+        -111520: 'Pinpad error: Invalid data in header',
+        -111521: 'Pinpad error: Incorrect password',
+        -111522: 'Pinpad error: Invalid key format',
+        -111523: 'Pinpad error: General unicreditbulbank error in smart card reader',
+        -111524: 'Pinpad error: Error code returned from HAL functions',
+        -111525: 'Pinpad error: Invalid key (may not be present)',
+        -111526: 'Pinpad error: The PIN length is less than 4 or bigger than 12',
+        -111527: 'Pinpad error: Issuer or ICC key invalid remainder length',
+        -111528: 'Pinpad error: Not initialized (Not used in this FW version)',
+        -111529: 'Pinpad error: Limit is reached (Not used in this FW version)',
+        -111530: 'Pinpad error: Invalid sequence (Not used in this FW version)',
+        -111531: 'Pinpad error: The action is not permitted',
+        -111532: 'Pinpad error: TMK is not loaded. The action cannot be executed',
+        -111533: 'Pinpad error: Wrong key format',
+        -111534: 'Pinpad error: Duplicated key',
+        -111535: 'Pinpad error: General keyboard error',
+        -111536: 'Pinpad error: The keyboard is no calibrated.',
+        -111537: 'Pinpad error: Keyboard bug detected.',
+        -111538: 'Pinpad error: The device is busy, try again',
+        -111539: 'Pinpad error: Device is tampered',
+        -111540: 'Pinpad error: Error in encrypted head',
+        -111541: 'Pinpad error: The button OK is pressed',
+        -111542: 'Pinpad error: Wrong PAN',
+        -111543: 'Pinpad error: Out of memory',
+        -111544: 'Pinpad error: EMV error',
+        -111545: 'Pinpad error: Cryptographic error',
+        -111546: 'Pinpad error: Communication error',
+        -111547: 'Pinpad error: Invalid firmware version',
+        -111548: 'Pinpad error: Printer is out of paper',
+        -111549: 'Pinpad error: Printer is overheated',
+        -111550: 'Pinpad error: Device is not connected',
+        -111551: 'Pinpad error: Use the chip reader',
+        -111552: 'Pinpad error: End the day first',
+        -111554: 'Pinpad error: Error from Borica',
+        -111555: 'Pinpad error: No connection with pinpad',
+        -111556: 'Pinpad error: Success in pinpad, unsuccess in ECR',
+        -111557: 'Pinpad error: Not configured connection between fiscal device and PinPad',
+        -111558: 'Pinpad error: The last transactions are equals or connection is interrupted - try again.',
+        -111559: 'Pinpad error: Payment type: debit/credit card via PinPad. '
+                 'In the fiscal receipt is allowed only one payment with such type.',
+        -111560: 'Pinpad error: Unknown result of the transaction between fiscal device and PinPad',
+        -111561: 'Pinpad error: Pinpad type not configured',
+        -111700: 'Pinpad error: Invalid ammount.',
+        -111701: 'Pinpad error: Transaction not found.',
+        -111702: 'Pinpad error: The file is empty.',
+        -111703: 'Entered cashback is bigger than cashback limit.',
+
+        -111800: 'ERR_SCALE_NOT_RESPOND',
+        -111801: 'ERR_SCALE_NOT_CALCULATED',
+        -111802: 'ERR_SCALE_WRONG_RESPONSE',
+        -111803: 'ERR_SCALE_ZERO_WEIGHT',
+        -111804: 'ERR_SCALE_NEGATIVE_WEIGHT',
+        -111805: 'ERR_SCALE_T_WRONG_INTF',
+        -111806: 'ERR_SCALE_T_CONNECT',
+        -111807: 'ERR_SCALE_SEND',
+        -111808: 'ERR_SCALE_RECEIVE',
+        -111809: 'ERR_SCALE_FILE_GENERATE',
+        -111810: 'ERR_SCALE_NOT_CONFIG',
+
+        -111900: 'Communication error wtih NTP server: Cannot make communication',
+        -111901: 'Communication error wtih NTP server: '
+                 'The date and time is earlier than the last saved in the fiscal memory',
+        -111902: 'Communication error wtih NTP server: Wrong IP address',
+
+        -112000: 'Fiscal printer error: Fiscal printer invalid command',
+        -112001: 'Fiscal printer error: Fiscal printer command invalid syntax',
+        -112002: 'Fiscal printer error: Command is not permitted',
+        -112003: 'Fiscal printer error: Register overflow',
+        -112004: 'Fiscal printer error: Wrong date/time',
+        -112005: 'Fiscal printer error: PC mode is needed',
+        -112006: 'Fiscal printer error: No paper',
+        -112007: 'Fiscal printer error: Cover is open',
+        -112008: 'Fiscal printer error: Printing mechanism error',
+
+        -112100: '_ERR_FP_SYNTAX_PARAM_BEGIN',
+        -112101: 'Invalid syntax of parameter 1.',
+        -112102: 'Invalid syntax of parameter 2.',
+        -112103: 'Invalid syntax of parameter 3.',
+        -112104: 'Invalid syntax of parameter 4.',
+        -112105: 'Invalid syntax of parameter 5.',
+        -112106: 'Invalid syntax of parameter 6.',
+        -112107: 'Invalid syntax of parameter 7.',
+        -112108: 'Invalid syntax of parameter 8.',
+        -112109: 'Invalid syntax of parameter 9.',
+        -112110: 'Invalid syntax of parameter 10.',
+        -112111: 'Invalid syntax of parameter 11.',
+        -112112: 'Invalid syntax of parameter 12.',
+        -112113: 'Invalid syntax of parameter 13.',
+        -112114: 'Invalid syntax of parameter 14.',
+        -112115: 'Invalid syntax of parameter 15.',
+        -112116: 'Invalid syntax of parameter 16.',
+        -112199: '_ERR_FP_SYNTAX_PARAM_END',
+
+        -112200: '_ERR_FP_BAD_PARAM_BEGIN',
+        -112201: 'Bad value of parameter 1.',
+        -112202: 'Bad value of parameter 2.',
+        -112203: 'Bad value of parameter 3.',
+        -112204: 'Bad value of parameter 4.',
+        -112205: 'Bad value of parameter 5.',
+        -112206: 'Bad value of parameter 6.',
+        -112207: 'Bad value of parameter 7.',
+        -112208: 'Bad value of parameter 8.',
+        -112209: 'Bad value of parameter 9.',
+        -112210: 'Bad value of parameter 10.',
+        -112211: 'Bad value of parameter 11.',
+        -112212: 'Bad value of parameter 12.',
+        -112213: 'Bad value of parameter 13.',
+        -112214: 'Bad value of parameter 14.',
+        -112215: 'Bad value of parameter 15.',
+        -112216: 'Bad value of parameter 16.',
+        -112299: '_ERR_FP_BAD_PARAM_END',
+
+        -113000: 'Flash memory error: Reading ID error',
+        -113001: 'Flash memory error: Sector size error',
+
+        -118000: 'ECR server error: The connection socket is not open',
+        -118001: 'ECR server error: The set for this command is not opened',
+        -118002: 'ECR server error: Wrong parameter',
+        -118003: 'ECR server error: Socket send error. Could not send data to server',
+        -118004: 'ECR server error: Receiving timeout. No data is receivec on time',
+        -118005: 'ECR server error: Socket is closed',
+        -118006: 'ECR server error: Unknown state',
+        -118007: 'ECR server error: Forbidden operation',
+
+        -120000: 'Programming: Name is not unique!',
+        -120001: 'Programming: Operator password is not unique!',
+        -120002: 'Programming: Date and time is under the range.',
+        -120003: 'Programming: Date and time is under the range.',
+
+        -121000: 'Barcode scanner reading error!',
+        -121001: 'Invalid EIK/EGN number!',
+
+        -170000: 'USB error: Host init error',
+        -170001: 'USB error: No device',
+        -170002: 'USB error: No filesystem',
+        -170003: 'USB error: File open error',
+        -170004: 'USB error: File copy error',
+
+    }
 
@@ -0,0 +1,130 @@
+import time
+from collections import namedtuple
+from concurrent.futures import (ThreadPoolExecutor, wait)
+
+from connector import from_url
+from ecr import DatecsFiscalDevice
+from protocol import DatecsProtocol
+
+
+# Configured device of a large fleet. Holds only the address; the connector and the
+# DatecsFiscalDevice are created on open() and dropped again on close().
+class DeviceHandle:
+
+    __slots__ = ('url', 'protocol', 'serial_number', 'store', 'device')
+
+    def __init__(self, url, protocol, serial_number=None, store=None):
+        self.url = url
+        self.protocol = protocol if isinstance(protocol, DatecsProtocol) else DatecsProtocol[protocol]
+        self.serial_number = serial_number
+        self.store = store
+        self.device = None
+
+    def __repr__(self):
+        return 'DeviceHandle({0:s}, {1:s})'.format(self.url, self.protocol.name)
+
+    @property
+    def is_open(self):
+        return self.device is not None and self.device.connected
+
+    def open(self, **kwargs):
+        # kwargs go to DatecsFiscalDevice (response_timeout, tracer, ...)
+        if self.device is None:
+            self.device = DatecsFiscalDevice(from_url(self.url), self.protocol, **kwargs)
+        if not self.device.connected:
+            self.device.connect()
+            self.serial_number = self.device.serial_number
+        return self.device
+
+    def close(self):
+        if self.device is not None:
+            if self.device.connected:
+                self.device.disconnect()
+            self.device = None
+
+
+def from_inventory(devices, store=None):
+    # devices: records of discovery.inventory()
+    return [DeviceHandle(d['url'], d['protocol'], d.get('serial_number'), d.get('store', store))
+            for d in devices]
+
+
+def status(fd):
+    fd.get_status()
+    flags = fd.last_response.status_flags()
+    flags.update({'model': fd.model, 'serial_number': fd.serial_number})
+    return flags
+
+
+def bon_timestamp(fd):
+    fd.read_bon_timestamp()
+    return fd.last_slip_timestamp
+
+
+# Read-only operations allowed in fleet queries
+QUERIES = {
+    'get_status': status,
+    'get_date_time': lambda fd: fd.get_date_time(),
+    'get_cash_availability': lambda fd: fd.get_cash_availability(),
+    'read_bon_timestamp': bon_timestamp,
+}
+
+QueryRow = namedtuple('QueryRow', 'handle ok value error latency')
+
+
+class QueryResult:
+
+    def __init__(self, operation, rows, elapsed):
+        self.operation = operation
+        self.rows = rows
+        self.elapsed = elapsed
+
+    def completed(self):
+        return [r for r in self.rows if r.ok]
+
+    def failed(self):
+        return [r for r in self.rows if not r.ok]
+
+    def table(self):
+        lines = ['{0:<32s} {1:<6s} {2:>9s}  {3:s}'.format('device', 'ok', 'ms', 'value / error')]
+        for r in self.rows:
+            latency = '' if r.latency is None else '{0:.1f}'.format(r.latency * 1000)
+            lines.append('{0:<32s} {1:<6s} {2:>9s}  {3:s}'.format(
+                r.handle.url, str(r.ok), latency, str(r.value if r.ok else r.error)))
+        return '\n'.join(lines)
+
+
+def query_one(handle, operation, timeout):
+    # Handles opened for the query are closed again, a fleet query must not leave
+    # thousands of connections open
+    start = time.monotonic()
+    opened = not handle.is_open
+    try:
+        value = QUERIES[operation](handle.open(response_timeout=timeout))
+        return QueryRow(handle, True, value, None, time.monotonic() - start)
+    except Exception as e:
+        return QueryRow(handle, False, None, e, time.monotonic() - start)
+    finally:
+        if opened:
+            handle.close()
+
+
+def query(handles, operation, deadline=5.0, workers=64):
+    # Runs one read-only operation on all handles at once. Returns after the deadline at the
+    # latest with what completed by then; devices still running get a TimeoutError row.
+    if operation not in QUERIES:
+        raise ValueError('Not a read-only fleet query: ' + operation)
+
+    start = time.monotonic()
+    pool = ThreadPoolExecutor(max_workers=workers)
+    futures = [pool.submit(query_one, h, operation, deadline) for h in handles]
+    wait(futures, timeout=deadline)
+    pool.shutdown(wait=False, cancel_futures=True)  # stragglers finish in the background
+
+    rows = []
+    for handle, future in zip(handles, futures):
+        if future.done() and not future.cancelled():
+            rows.append(future.result())
+        else:
+            rows.append(QueryRow(handle, False, None, TimeoutError('Deadline exceeded'), None))
+    return QueryResult(operation, rows, time.monotonic() - start)
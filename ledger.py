@@ -0,0 +1,61 @@
+import threading
+import time
+
+
+# Drawer cash kept locally from cash in/out operations and cash receipts, so the POS can
+# ask for it without a round trip. It is reconciled with the device every interval;
+# a difference found at reconciliation is reported as drift.
+class CashLedger:
+
+    def __init__(self, interval=300.0, tolerance=0.005):
+        self.interval = interval
+        self.tolerance = tolerance
+        self.figures = None     # {'CashSum', 'ServIn', 'ServOut'}, None until synced
+        self.synced_at = None
+        self.callbacks = []
+        self.lock = threading.Lock()
+
+    def on_drift(self, callback):
+        # callback(ledger, {name: device - local})
+        self.callbacks.append(callback)
+
+    def valid(self):
+        return self.figures is not None and time.monotonic() - self.synced_at < self.interval
+
+    def invalidate(self):
+        with self.lock:
+            self.figures = None
+
+    def get(self):
+        with self.lock:
+            return dict(self.figures) if self.figures is not None else None
+
+    def sync(self, figures):
+        with self.lock:
+            local = self.figures
+            self.figures = dict(figures)
+            self.synced_at = time.monotonic()
+        if local is None:
+            return {}
+        drift = {k: round(figures[k] - local[k], 2) for k in figures
+                 if abs(figures[k] - local[k]) > self.tolerance}
+        if drift:
+            for callback in self.callbacks:
+                callback(self, drift)
+        return drift
+
+    def cash_in_out(self, amount):
+        with self.lock:
+            if self.figures is None:
+                return
+            self.figures['CashSum'] = round(self.figures['CashSum'] + amount, 2)
+            if amount > 0:
+                self.figures['ServIn'] = round(self.figures['ServIn'] + amount, 2)
+            else:
+                self.figures['ServOut'] = round(self.figures['ServOut'] - amount, 2)
+
+    def sale(self, amount):
+        # Cash kept in the drawer from a receipt, negative for storno
+        with self.lock:
+            if self.figures is not None:
+                self.figures['CashSum'] = round(self.figures['CashSum'] + amount, 2)
@@ -0,0 +1,121 @@
+import time
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from bon import (FiscalBon, Product, PayMode)
+from connector import EthernetConnector
+from ecr import DatecsFiscalDevice
+from emulator import (EcrEmulator, EmulatorServer)
+from protocol import DatecsProtocol
+
+
+def drive(address, protocol_name, receipts, rate, lines):
+    # Prints receipts on one device at a fixed rate (receipts per second). Latency is measured
+    # from the scheduled start, so a device falling behind shows up in the tail.
+    fd = DatecsFiscalDevice(EthernetConnector(*address), DatecsProtocol[protocol_name])
+    fd.connect()
+    latencies = []
+    errors = 0
+    cpu = time.thread_time()
+    start = time.monotonic()
+    try:
+        for i in range(receipts):
+            scheduled = start + i / rate
+            wait = scheduled - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            bon = FiscalBon(1, 1, 1)
+            for n in range(lines):
+                bon.add(Product('Item {0:d}'.format(n), 1.0, 1.25))
+            bon.close(bon.total, PayMode.CASH)
+            try:
+                fd.print(bon)
+            except Exception:
+                errors += 1
+            latencies.append(time.monotonic() - scheduled)
+    finally:
+        fd.disconnect()
+    return {'latencies': latencies, 'errors': errors, 'cpu': time.thread_time() - cpu,
+            'elapsed': time.monotonic() - start}
+
+
+def drive_group(args):
+    # One worker process driving its share of devices from threads
+    results = [None] * len(args)
+
+    def run(i):
+        results[i] = drive(*args[i])
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(len(args))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+def percentile(values, p):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(p / 100.0 * (len(values) - 1))))]
+
+
+def run(devices=10, rate=10.0, duration=10.0, processes=1, lines=5, latency=0.005,
+        protocol=DatecsProtocol.X):
+    # devices: fake ECRs started locally; rate: receipts per second over all devices;
+    # processes: devices are split over that many worker processes, one thread per device
+    servers = [EmulatorServer(EcrEmulator(protocol, serial_number='DT{0:06d}'.format(i),
+                                          latency=latency)).start() for i in range(devices)]
+    per_device = rate / devices
+    receipts = max(1, int(duration * per_device))
+    args = [(s.address, protocol.name, receipts, per_device, lines) for s in servers]
+
+    started = time.monotonic()
+    try:
+        if processes <= 1:
+            results = drive_group(args)
+        else:
+            groups = [args[i::processes] for i in range(processes)]
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                results = [r for group in pool.map(drive_group, groups) for r in group]
+    finally:
+        for s in servers:
+            s.stop()
+    elapsed = time.monotonic() - started
+
+    latencies = [v for r in results for v in r['latencies']]
+    done = len(latencies) - sum(r['errors'] for r in results)
+    return {'devices': devices,
+            'receipts': done,
+            'errors': sum(r['errors'] for r in results),
+            'throughput': done / elapsed,
+            'p50': percentile(latencies, 50),
+            'p95': percentile(latencies, 95),
+            'p99': percentile(latencies, 99),
+            'max': max(latencies) if latencies else 0.0,
+            'cpu_per_device': sum(r['cpu'] for r in results) / devices,
+            'cpu_per_receipt': sum(r['cpu'] for r in results) / max(1, done)}
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Load test DatecsFiscalDevice against fake ECRs')
+    parser.add_argument('--devices', type=int, default=10)
+    parser.add_argument('--rate', type=float, default=10.0, help='receipts per second, all devices')
+    parser.add_argument('--duration', type=float, default=10.0, help='seconds')
+    parser.add_argument('--processes', type=int, default=1)
+    parser.add_argument('--lines', type=int, default=5, help='sale lines per receipt')
+    parser.add_argument('--latency', type=float, default=0.005, help='seconds per command')
+    parser.add_argument('--protocol', choices=['OLD', 'X'], default='X')
+    args = parser.parse_args()
+
+    r = run(args.devices, args.rate, args.duration, args.processes, args.lines, args.latency,
+            DatecsProtocol[args.protocol])
+    print('Devices: {0:d}, receipts: {1:d}, errors: {2:d}'.format(r['devices'], r['receipts'], r['errors']))
+    print('Throughput: {0:.1f} receipts/s'.format(r['throughput']))
+    print('Latency p50/p95/p99/max: {0:.3f} / {1:.3f} / {2:.3f} / {3:.3f} s'.format(
+        r['p50'], r['p95'], r['p99'], r['max']))
+    print('CPU: {0:.3f} s per device, {1:.2f} ms per receipt'.format(
+        r['cpu_per_device'], r['cpu_per_receipt'] * 1000))
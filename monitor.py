@@ -0,0 +1,139 @@
+import heapq
+import random
+import threading
+import time
+
+from response import STATUS_BITS
+
+
+# Status bytes come with every answer, so the monitor listens to the regular traffic
+# and polls only devices that were quiet for a whole interval. One thread serves all
+# devices, polls due within `window` are done in one wake-up, next polls are jittered.
+class StatusMonitor:
+
+    def __init__(self, interval=5.0, jitter=0.2, window=0.5, busy_retry=0.5):
+        self.interval = interval
+        self.jitter = jitter
+        self.window = window
+        self.busy_retry = busy_retry
+        self.callbacks = []
+        self.error_callbacks = []
+        self.flags = {}
+        self.errors = {}
+        self._queue = []
+        self._seq = 0
+        self._entries = {}      # device: seq of its queued poll, older heap entries are stale
+        self._devices = set()
+        self._cond = threading.Condition()
+        self._thread = None
+        self._running = False
+
+    def on_change(self, callback):
+        # callback(device, bit_name, value)
+        self.callbacks.append(callback)
+
+    def on_error(self, callback):
+        # callback(device, exception)
+        self.error_callbacks.append(callback)
+
+    def add(self, device):
+        with self._cond:
+            if device in self._devices:
+                return
+            self._devices.add(device)
+            device.response_listeners.append(self.observe)
+            self._schedule(device, time.monotonic() + random.uniform(0, self.interval))
+            self._cond.notify()     # the thread may sleep until a later poll or for good
+
+    def remove(self, device):
+        with self._cond:
+            self._devices.discard(device)
+            if self._entries.pop(device, None) is not None:
+                self._queue = [e for e in self._queue if e[2] is not device]
+                heapq.heapify(self._queue)
+            self.flags.pop(device, None)
+            self.errors.pop(device, None)
+        if self.observe in device.response_listeners:
+            device.response_listeners.remove(self.observe)
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name='StatusMonitor', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def observe(self, device, fr):
+        # Called for every answer of the device, keep it cheap
+        previous = self.flags.get(device)
+        if previous is not None and previous[0] == fr.status_bytes:
+            return
+
+        flags = fr.status_flags()
+        self.flags[device] = (bytes(fr.status_bytes), flags)
+        self.errors.pop(device, None)
+
+        for name in STATUS_BITS:
+            old = previous[1][name] if previous is not None else False
+            if flags[name] != old:
+                for callback in self.callbacks:
+                    callback(device, name, flags[name])
+
+    def _schedule(self, device, due):
+        self._seq += 1
+        self._entries[device] = self._seq
+        heapq.heappush(self._queue, (due, self._seq, device))
+
+    def _next_due(self, base):
+        spread = self.interval * self.jitter
+        return base + self.interval + random.uniform(-spread, spread)
+
+    def _poll(self, device, now):
+        if device.last_activity is not None:
+            idle = device.clock.monotonic() - device.last_activity
+            if idle < self.interval:
+                return self._next_due(now - idle)  # status fresh from regular traffic
+
+        if not device.connected or not device.lock.acquire(blocking=False):
+            return now + self.busy_retry  # device busy with a command, try again soon
+
+        try:
+            device.read_status()
+        except Exception as e:
+            self.errors[device] = e
+            for callback in self.error_callbacks:
+                callback(device, e)
+        finally:
+            device.lock.release()
+
+        return self._next_due(time.monotonic())
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._running and (not self._queue or self._queue[0][0] > time.monotonic()):
+                    timeout = self._queue[0][0] - time.monotonic() if self._queue else None
+                    self._cond.wait(timeout)
+                if not self._running:
+                    return
+
+                batch = []
+                limit = time.monotonic() + self.window
+                while self._queue and self._queue[0][0] <= limit:
+                    _, seq, device = heapq.heappop(self._queue)
+                    if self._entries.get(device) == seq:
+                        batch.append((device, seq))
+
+            for device, seq in batch:
+                if self._entries.get(device) != seq:
+                    continue    # removed meanwhile
+                due = self._poll(device, time.monotonic())
+                with self._cond:
+                    if self._entries.get(device) == seq:    # not removed or re-added meanwhile
+                        self._schedule(device, due)
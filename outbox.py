@@ -0,0 +1,199 @@
+import json
+import os
+import threading
+from datetime import datetime
+
+from bon import FiscalBon
+from ecr import DatecsError
+
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+# Durable FIFO of receipts for one device, one JSON file per receipt. A receipt being
+# printed is renamed to .sending with the slip number and the time before it, so after
+# a crash the device can tell whether it got out.
+class Outbox:
+
+    def __init__(self, directory, max_entries=10000, max_bytes=50 * 1024 * 1024):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        names = self.names()
+        self.seq = int(names[-1].split('.')[0]) + 1 if names else 1
+        self.size = sum(os.path.getsize(os.path.join(directory, n)) for n in names)
+
+    def names(self):
+        return sorted(n for n in os.listdir(self.directory) if n.endswith(('.json', '.sending')))
+
+    def __len__(self):
+        return len(self.names())
+
+    @staticmethod
+    def sending_data(bon, last_slip, since):
+        return json.dumps({'bon': bon.to_dict(), 'last_slip': last_slip,
+                           'since': since.strftime(TIME_FORMAT)}).encode('utf-8')
+
+    def put(self, bon, last_slip=None, since=None):
+        # With last_slip the receipt may be out already, it is queued as .sending;
+        # since: when its printing was started
+        if last_slip is None:
+            data = json.dumps(bon.to_dict()).encode('utf-8')
+        else:
+            data = self.sending_data(bon, last_slip, since)
+        with self.lock:
+            if len(self) >= self.max_entries or self.size + len(data) > self.max_bytes:
+                raise Exception('Outbox full: ' + self.directory)
+            name = '{0:012d}.{1:s}'.format(self.seq, 'json' if last_slip is None else 'sending')
+            self.seq += 1
+            tmp = os.path.join(self.directory, name + '.tmp')
+            with open(tmp, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, os.path.join(self.directory, name))
+            self.size += len(data)
+        return name
+
+    def head(self):
+        # (name, bon, last slip and time before printing or None), None when empty
+        names = self.names()
+        if not names:
+            return None
+        with open(os.path.join(self.directory, names[0])) as f:
+            d = json.load(f)
+        since = datetime.strptime(d['since'], TIME_FORMAT) if d.get('since') else None
+        return names[0], FiscalBon.from_dict(d.get('bon', d)), d.get('last_slip'), since
+
+    def sending(self, name, bon, last_slip):
+        # Marks the head as being printed, the slip number and the time before it are kept with it
+        path = os.path.join(self.directory, name)
+        sending = path if name.endswith('.sending') else path[:-len('.json')] + '.sending'
+        data = self.sending_data(bon, last_slip, datetime.now())
+        with self.lock:
+            self.size -= os.path.getsize(path)
+            with open(sending + '.tmp', 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(sending + '.tmp', sending)
+            if sending != path:
+                os.remove(path)
+            self.size += len(data)
+        return os.path.basename(sending)
+
+    def done(self, name):
+        path = os.path.join(self.directory, name)
+        with self.lock:
+            self.size -= os.path.getsize(path)
+            os.remove(path)
+
+    def fail(self, name):
+        # Receipts refused by the device are kept aside as .failed, out of the queue
+        path = os.path.join(self.directory, name)
+        with self.lock:
+            self.size -= os.path.getsize(path)
+            os.replace(path, path.rsplit('.', 1)[0] + '.failed')
+
+
+# Prints receipts directly while the device is up and queues them in the outbox while it is
+# down. Recovery is probed with one status command, with backoff; the backlog is then printed
+# back to back in order before new receipts.
+class OutboxForwarder:
+
+    def __init__(self, fd, outbox, probe_interval=2.0, max_probe_interval=60.0):
+        self.fd = fd
+        self.outbox = outbox
+        self.probe_interval = probe_interval
+        self.max_probe_interval = max_probe_interval
+        self.callbacks = []
+        self.up = True
+        self.wakeup = threading.Event()
+        self.running = False
+        self.thread = None
+
+    def on_progress(self, callback):
+        # callback(sent, remaining, error); error: why a receipt was moved to .failed, or None
+        self.callbacks.append(callback)
+
+    def start(self):
+        self.running = True
+        self.thread = threading.Thread(target=self.run, name='OutboxForwarder', daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        self.wakeup.set()
+        self.thread.join()
+
+    def print(self, bon):
+        # Returns True when printed now, False when queued
+        last_slip = None
+        since = datetime.now()
+        if self.up and len(self.outbox) == 0:
+            try:
+                last_slip = self.fd.read_last_slip()
+                self.fd.print(bon, recover=True)
+                return True
+            except OSError:
+                self.up = False     # after last_slip was read the receipt may be out, recover() decides
+        self.outbox.put(bon, last_slip, since)
+        self.wakeup.set()
+        return False
+
+    def probe(self):
+        try:
+            if not self.fd.connected:
+                self.fd.connect()
+            else:
+                self.fd.read_status()
+            return True
+        except DatecsError:
+            return True     # it answered
+        except OSError:
+            return False
+
+    def send_head(self):
+        name, bon, last_slip, since = self.outbox.head()
+        if name.endswith('.sending'):
+            # Left by a crash or outage. When other documents came meanwhile recover() can't tell
+            # whether the receipt got out and raises, the entry then goes to .failed
+            result = self.fd.recover(bon, None, last_slip, since)
+            if result in ('not_printed', 'cancelled'):
+                self.fd.print(bon, recover=True)
+        else:
+            name = self.outbox.sending(name, bon, self.fd.read_last_slip())
+            self.fd.print(bon, recover=True)
+        self.outbox.done(name)
+
+    def run(self):
+        delay = self.probe_interval
+        sent = 0
+        while self.running:
+            if len(self.outbox) == 0:
+                sent = 0
+                self.wakeup.wait()
+                self.wakeup.clear()
+                continue
+            if not self.up:
+                if not self.probe():
+                    self.wakeup.wait(delay)
+                    self.wakeup.clear()
+                    delay = min(delay * 2, self.max_probe_interval)
+                    continue
+                self.up = True
+                delay = self.probe_interval
+            error = None
+            try:
+                self.send_head()
+            except OSError:
+                self.up = False
+                continue
+            except Exception as e:
+                # Refused or unreadable receipt, put aside so the rest of the queue can go
+                error = e
+                self.outbox.fail(self.outbox.names()[0])
+            sent += 1
+            for callback in self.callbacks:
+                callback(sent, len(self.outbox), error)
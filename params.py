@@ -0,0 +1,64 @@
+import json
+import os
+import threading
+
+
+# Programmed parameters per device serial number. The device reads through the cache and
+# invalidates its entries on writes. With a path the cache survives restarts; new values
+# are saved at most once per save_delay, invalidations at once.
+class ParameterCache:
+
+    def __init__(self, path=None, save_delay=1.0):
+        self.path = path
+        self.save_delay = save_delay
+        self.values = {}
+        self.lock = threading.Lock()
+        self.timer = None
+        if path is not None and os.path.exists(path):
+            self.load()
+
+    @staticmethod
+    def key(name, index):
+        return '{0:s}[{1:s}]'.format(name, str(index))
+
+    def get(self, serial_number, name, index=''):
+        # Returns None on miss
+        return self.values.get(serial_number, {}).get(self.key(name, index))
+
+    def put(self, serial_number, name, index, value):
+        with self.lock:
+            self.values.setdefault(serial_number, {})[self.key(name, index)] = value
+            if self.path is not None and self.timer is None:
+                self.timer = threading.Timer(self.save_delay, self.flush)
+                self.timer.daemon = True
+                self.timer.start()
+
+    def invalidate(self, serial_number=None, name=None, index=''):
+        with self.lock:
+            if serial_number is None:
+                self.values.clear()
+            elif name is None:
+                self.values.pop(serial_number, None)
+            else:
+                self.values.get(serial_number, {}).pop(self.key(name, index), None)
+            self.save()
+
+    def load(self):
+        with open(self.path) as f:
+            self.values = json.load(f)
+
+    def flush(self):
+        with self.lock:
+            self.save()
+
+    def save(self):
+        # Called with the lock held
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        if self.path is None:
+            return
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(self.values, f, indent=2)
+        os.replace(tmp, self.path)
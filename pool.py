@@ -0,0 +1,100 @@
+import queue
+import threading
+from concurrent.futures import Future
+
+
+class PoolMember:
+
+    def __init__(self, fd):
+        self.fd = fd
+        self.pending = 0        # commands queued or running
+        self.checked = None     # when a skipped device was last asked for its status
+        self.queue = queue.Queue()
+        self.thread = None
+
+
+# Routes non-fiscal jobs (slips, reports, copies) over several devices to the one expected
+# to finish first: (queued commands + job commands) * measured command latency.
+# Devices whose last answer showed no paper or an open cover are skipped; they are asked
+# for their status again at most every recheck seconds, to notice the refill.
+class PrintPool:
+
+    def __init__(self, devices, default_latency=0.05, recheck=2.0):
+        self.default_latency = default_latency  # for devices without a measured latency yet
+        self.recheck = recheck
+        self.members = [PoolMember(fd) for fd in devices]
+        self.lock = threading.Lock()
+        for m in self.members:
+            m.thread = threading.Thread(target=self.run, args=(m,), name='PrintPool', daemon=True)
+            m.thread.start()
+
+    @staticmethod
+    def ready(fr):
+        return fr is None or not (fr.end_of_paper() or fr.cover_open())
+
+    def available(self, member):
+        fd = member.fd
+        if self.ready(fd.last_response):
+            return True
+        t = fd.clock.monotonic()
+        if member.checked is not None and t - member.checked < self.recheck:
+            return False
+        member.checked = t
+        if not fd.connected or not fd.lock.acquire(blocking=False):
+            return False    # busy, its answers will tell
+        try:
+            return self.ready(fd.read_status())
+        except Exception:
+            return False
+        finally:
+            fd.lock.release()
+
+    def estimate(self, member, commands):
+        latency = member.fd.latency if member.fd.latency is not None else self.default_latency
+        return (member.pending + commands) * latency
+
+    def submit(self, job, commands=1):
+        # job(fd) runs on the chosen device; commands: its round trips, for the estimate.
+        # commands may be a callable(fd) when the count depends on the device.
+        with self.lock:
+            best = None
+            for m in self.members:
+                if not self.available(m):
+                    continue
+                n = commands(m.fd) if callable(commands) else commands
+                t = self.estimate(m, n)
+                if best is None or t < best[0]:
+                    best = (t, m, n)
+            if best is None:
+                raise Exception('No printer available')
+            _, member, n = best
+            member.pending += n
+
+        future = Future()
+        member.queue.put((job, n, future))
+        return future
+
+    def print_text(self, lines, line_width=None, pack=False):
+        lines = list(lines)
+        return self.submit(lambda fd: fd.print_nonfiscal(lines, line_width, pack),
+                           lambda fd: len(fd.pack_text(lines, line_width, pack)) + 2)
+
+    def run(self, member):
+        while True:
+            item = member.queue.get()
+            if item is None:
+                return
+            job, n, future = item
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(job(member.fd))
+                except Exception as e:
+                    future.set_exception(e)
+            with self.lock:
+                member.pending -= n
+
+    def close(self):
+        for m in self.members:
+            m.queue.put(None)
+        for m in self.members:
+            m.thread.join()
@@ -1,4 +1,5 @@
 from enum import Enum
+from functools import lru_cache
 
 PREAMBLE = b'\x01'
 POSTAMBLE = b'\x05'
@@ -14,11 +15,18 @@ class DatecsProtocol(Enum):
     X = 2
 
     def __init__(self, value):
-        self.seq = SEQ_START
         if value == 1:       # OLD
             self.SEP = ','
+            self.MAX_DATA = 218
+            self.MAX_NAME = 36
+            self.PRINT_WIDTH = 30   # free text characters per printed line, 57mm paper
         else:                # X
             self.SEP = '\t'
+            self.MAX_DATA = 496
+            self.MAX_NAME = 72
+            self.PRINT_WIDTH = 42
+        self.MAX_UNIT = 6
+        self.MAX_LINES = 512        # sale lines in one receipt
 
     @classmethod
     def encode_word(cls, w) -> bytearray:
@@ -35,17 +43,21 @@ class DatecsProtocol(Enum):
         sep = packet.find(SEPARATOR)
         return packet[sep + 1:sep + 8]
 
+    @classmethod
+    def detect(cls, packet, cmd):
+        # The answer echoes the command code: one byte at [3] for OLD, encoded word at [6:10] for X
+        if len(packet) >= 10 and packet[6:10] == cls.encode_word(cmd):
+            return cls.X
+        if len(packet) >= 4 and packet[3] == cmd:
+            return cls.OLD
+        return None
+
     def calc_bcc(self, packet) -> bytearray:
         return self.encode_word(sum(packet) & 0xffff)
 
-    def format_packet(self, cmd, data) -> bytearray:
-
-        if self.seq >= SEQ_MAX:
-            self.seq = SEQ_START
-        else:
-            self.seq += 1
-
-        seq_byte = self.seq.to_bytes(1, "big")
+    def format_packet(self, seq, cmd, data) -> bytearray:
+        # seq is kept per device, the protocol members are shared by all devices
+        seq_byte = seq.to_bytes(1, "big")
 
         if self.value == 1:  # Protocol.OLD
             packet_len = (0x24 + len(data)).to_bytes(1, "big")
@@ -59,9 +71,23 @@ class DatecsProtocol(Enum):
 
         return PREAMBLE + packet + bcc + TERMINATOR
 
-    def get_data(self, packet):
+    def get_data(self, packet, codepage='cp1251'):
         sep = packet.find(SEPARATOR)
         if self.value == 1:  # Protocol.OLD
-            return packet[4:sep].decode()
+            return packet[4:sep].decode(codepage, 'replace')
         else:                # Protocol.X
-            return packet[10:sep - 1].decode()
+            return packet[10:sep - 1].decode(codepage, 'replace')
+
+
+class EncodedStrings:
+    # Bounded cache of encoded, length truncated catalogue strings (product names, units,
+    # operators), a fixed catalogue is then encoded once and not on every sale
+
+    def __init__(self, codepage, size=8192):
+        self.codepage = codepage
+        self.get = lru_cache(maxsize=size)(self.encode)
+
+    def encode(self, text, max_len=None):
+        # Characters missing in the codepage are printed as '?'
+        data = text.encode(self.codepage, 'replace')
+        return data[:max_len] if max_len is not None else data
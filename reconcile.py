@@ -0,0 +1,88 @@
+import numpy as np
+
+from bon import PayMode
+
+PAY_MODES = list(PayMode)
+TAX_GROUPS = 8      # A..H, tax code 1..8
+
+
+def cents(amount):
+    return np.rint(np.asarray(amount, dtype=np.float64) * 100).astype(np.int64)
+
+
+class DayData:
+    # Column arrays of one day: receipt lines, receipts and cash in/out operations.
+    # Amounts are kept in cents, storno receipts carry sign -1.
+
+    def __init__(self, line_receipt, line_tax, line_amount,
+                 receipt_pay_mode, receipt_operator, receipt_sign, cash_ops):
+        self.line_receipt = np.asarray(line_receipt, dtype=np.int64)
+        self.line_tax = np.asarray(line_tax, dtype=np.int64)
+        self.line_amount = cents(line_amount)
+        self.receipt_pay_mode = np.asarray(receipt_pay_mode, dtype=np.int64)
+        self.receipt_operator = np.asarray(receipt_operator, dtype=np.int64)
+        self.receipt_sign = np.asarray(receipt_sign, dtype=np.int64)
+        self.cash_ops = cents(cash_ops)
+
+    @classmethod
+    def from_bons(cls, bons, cash_ops=()):
+        line_receipt, line_tax, line_amount = [], [], []
+        pay_mode, operator, sign = [], [], []
+        for i, bon in enumerate(bons):
+            for p in bon.products:
+                line_receipt.append(i)
+                line_tax.append(int(p.tax_cd))
+                line_amount.append(p.total())
+            pay_mode.append(PAY_MODES.index(bon.pay_mode))
+            operator.append(int(bon.operator))
+            sign.append(1 if bon.storno_reason is None else -1)
+        return cls(line_receipt, line_tax, line_amount, pay_mode, operator, sign, list(cash_ops))
+
+    def totals(self):
+        # One pass over the line arrays, per receipt sums are spread by receipt attributes
+        signed = self.line_amount * self.receipt_sign[self.line_receipt]
+        receipt = np.bincount(self.line_receipt, weights=signed,
+                              minlength=len(self.receipt_sign)).astype(np.int64)
+        tax = np.bincount(self.line_tax - 1, weights=signed, minlength=TAX_GROUPS).astype(np.int64)
+        pay_mode = np.bincount(self.receipt_pay_mode, weights=receipt,
+                               minlength=len(PAY_MODES)).astype(np.int64)
+
+        operators, index = np.unique(self.receipt_operator, return_inverse=True)
+        by_operator = np.bincount(index, weights=receipt, minlength=len(operators)).astype(np.int64)
+
+        serv_in = int(self.cash_ops[self.cash_ops > 0].sum())
+        serv_out = int(-self.cash_ops[self.cash_ops < 0].sum())
+        cash_sum = int(pay_mode[PAY_MODES.index(PayMode.CASH)]) + serv_in - serv_out
+
+        return {'tax': tax,
+                'pay_mode': pay_mode,
+                'operator': dict(zip(operators.tolist(), by_operator.tolist())),
+                'CashSum': cash_sum,
+                'ServIn': serv_in,
+                'ServOut': serv_out}
+
+
+class Reconciliation:
+
+    def __init__(self, local, device_tax, device_cash, tolerance=0):
+        self.local = local
+        self.device_tax = device_tax
+        self.device_cash = device_cash
+        self.tax_diff = device_tax - local['tax'][:len(device_tax)]
+        self.cash_diff = {k: device_cash[k] - local[k] for k in ('CashSum', 'ServIn', 'ServOut')}
+        self.ok = bool(np.all(np.abs(self.tax_diff) <= tolerance)) and \
+            all(abs(d) <= tolerance for d in self.cash_diff.values())
+
+    def differences(self):
+        # Amounts device minus local, in currency units
+        diff = {'Tax' + chr(ord('A') + i): d / 100.0 for i, d in enumerate(self.tax_diff.tolist()) if d}
+        diff.update({k: d / 100.0 for k, d in self.cash_diff.items() if d})
+        return diff
+
+
+def reconcile(fd, day, tolerance=0):
+    # day: DayData; tolerance in cents
+    device_tax = cents(fd.get_daily_totals())
+    cash = fd.get_cash_availability(refresh=True)   # the device figures, not the local ledger
+    device_cash = {k: int(cents(cash[k])) for k in ('CashSum', 'ServIn', 'ServOut')}
+    return Reconciliation(day.totals(), device_tax, device_cash, tolerance)
@@ -1,7 +1,12 @@
 
+STATUS_BITS = ('cover_open', 'general_error', 'mechanism_failure', 'rtc_not_synchronized',
+               'invalid_command', 'syntax_error', 'command_not_permitted', 'overflow_during_command',
+               'nonfiscal_receipt_open', 'fiscal_receipt_open', 'end_of_paper')
+
+
 class FiscalResponse:
-    def __init__(self, packet, protocol):
-        self.data = protocol.get_data(packet)
+    def __init__(self, packet, protocol, codepage='cp1251'):
+        self.data = protocol.get_data(packet, codepage)
         self.values = self.data.split(protocol.SEP)
         self.status_bytes = protocol.get_status(packet)
         self.ok = not (self.general_error() or self.cover_open())
@@ -23,7 +28,7 @@ class FiscalResponse:
         return self.ok
 
     def bit_on(self, x, n):
-        return self.status_bytes[x] & 1 << n-1 != 0
+        return self.status_bytes[x] & 1 << n != 0
 
     def cover_open(self): return self.bit_on(0, 6)
     def general_error(self): return self.bit_on(0, 5)
@@ -36,3 +41,6 @@ class FiscalResponse:
     def nonfiscal_receipt_open(self): return self.bit_on(2, 5)
     def fiscal_receipt_open(self): return self.bit_on(2, 3)
     def end_of_paper(self): return self.bit_on(2, 0)
+
+    def status_flags(self):
+        return {name: getattr(self, name)() for name in STATUS_BITS}
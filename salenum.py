@@ -0,0 +1,91 @@
+import os
+import threading
+
+try:
+    import fcntl
+
+    def lock_file(f):
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+    def unlock_file(f):
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+except ImportError:     # Windows
+    import msvcrt
+
+    def lock_file(f):
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+    def unlock_file(f):
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+MAX_SALE = 9999999      # NSale: LLLLLLLL-CCCC-DDDDDDD, 7 digits of the sequence
+WIDTH = 10              # the counter is rewritten in place with the same width, never truncated
+
+
+# Unique sale numbers per device, shared by processes through a small counter file.
+# A process reserves a block of numbers under a file lock and hands them out from memory.
+# Numbers of a block not used before a crash or restart are skipped, never reused.
+class SaleNumberAllocator:
+
+    def __init__(self, directory, serial_number, till=1, block=100):
+        self.path = os.path.join(directory, serial_number + '.nsale')
+        self.serial_number = serial_number
+        self.till = till
+        self.block = block
+        self.next = 0
+        self.end = 0
+        self.pid = os.getpid()
+        self.lock = threading.Lock()
+
+    def create(self):
+        # The counter file appears complete or not at all, an empty one is never left behind
+        tmp = '{0:s}.{1:d}.tmp'.format(self.path, os.getpid())
+        with open(tmp, 'wb') as f:
+            f.write('{0:0{1:d}d}'.format(1, WIDTH).encode('ascii'))
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.link(tmp, self.path)
+        except FileExistsError:
+            pass    # created by another process meanwhile
+        finally:
+            os.remove(tmp)
+
+    def reserve(self):
+        if not os.path.exists(self.path):
+            self.create()
+        with open(self.path, 'r+b') as f:
+            lock_file(f)
+            try:
+                f.seek(0)
+                data = f.read().strip()
+                if not data.isdigit():
+                    # reusing numbers is worse than stopping, the file needs a look
+                    raise Exception('Corrupt sale number file: ' + self.path)
+                start = int(data)
+                end = start + self.block
+                if end - 1 > MAX_SALE:
+                    raise Exception('Sale numbers exhausted for ' + self.serial_number)
+                f.seek(0)
+                f.write('{0:0{1:d}d}'.format(end, WIDTH).encode('ascii'))
+                f.flush()
+                os.fsync(f.fileno())
+            finally:
+                unlock_file(f)
+        self.next, self.end = start, end
+
+    def allocate(self):
+        with self.lock:
+            if self.pid != os.getpid():     # forked, the block belongs to the parent
+                self.pid = os.getpid()
+                self.next = self.end = 0
+            if self.next >= self.end:
+                self.reserve()
+            number = self.next
+            self.next += 1
+            return number
+
+    def n_sale(self):
+        return '{0:s}-{1:04d}-{2:07d}'.format(self.serial_number, self.till, self.allocate())
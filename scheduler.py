@@ -0,0 +1,140 @@
+import heapq
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+
+class Job:
+
+    def __init__(self, name, action, interval, retries=3, retry_delay=60.0):
+        self.name = name
+        self.action = action            # action(fd)
+        self.interval = interval        # seconds between regular runs
+        self.retries = retries
+        self.retry_delay = retry_delay  # doubled on each further retry
+
+
+def end_of_day(fd):
+    return fd.daily_report(zero=True)
+
+
+def clock_sync(fd):
+    return fd.set_date_time(datetime.now())
+
+
+def status_sweep(fd):
+    return fd.read_status().status_flags()
+
+
+# Runs recurring jobs over the fleet. A job runs on a device only when the device is idle;
+# busy devices and full stores are postponed, failed devices retried with backoff, and
+# neither blocks the others.
+class FleetScheduler:
+
+    def __init__(self, max_workers=16, per_store=2, idle_gap=2.0, busy_delay=5.0):
+        self.max_workers = max_workers
+        self.per_store = per_store
+        self.idle_gap = idle_gap        # no device traffic for that long before a job may start
+        self.busy_delay = busy_delay
+        self.stores = {}                # device -> store
+        self.running = {}               # store -> running jobs
+        self.results = {}               # (job name, device) -> (finished, ok, result or exception)
+        self.callbacks = []
+        self._queue = []
+        self._seq = 0
+        self._active = 0
+        self._cond = threading.Condition()
+        self._pool = None
+        self._thread = None
+        self._stopped = True
+
+    def on_result(self, callback):
+        # callback(job, device, ok, result or exception)
+        self.callbacks.append(callback)
+
+    def add_device(self, fd, store=None):
+        self.stores[fd] = store
+
+    def add_job(self, job, devices=None, start=None):
+        # start: first run time (time.time()), now by default
+        due = time.time() if start is None else start
+        with self._cond:
+            for fd in devices if devices is not None else list(self.stores):
+                self._push(due, job, fd, 0)
+            self._cond.notify()
+
+    def start(self):
+        self._stopped = False
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        self._thread = threading.Thread(target=self._run, name='FleetScheduler', daemon=True)
+        self._thread.start()
+
+    def stop(self, wait=True):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        self._thread.join()
+        self._pool.shutdown(wait=wait)
+
+    def idle(self, fd):
+        if fd.last_activity is not None and fd.clock.monotonic() - fd.last_activity < self.idle_gap:
+            return False
+        fr = fd.last_response
+        return fr is None or not (fr.fiscal_receipt_open() or fr.nonfiscal_receipt_open())
+
+    def _push(self, due, job, fd, attempt):
+        self._seq += 1
+        heapq.heappush(self._queue, (due, self._seq, job, fd, attempt))
+
+    def _run(self):
+        with self._cond:
+            while not self._stopped:
+                now = time.time()
+                if not self._queue or self._queue[0][0] > now or self._active >= self.max_workers:
+                    timeout = self._queue[0][0] - now if self._queue else None
+                    self._cond.wait(None if self._active >= self.max_workers else timeout)
+                    continue
+
+                due, _, job, fd, attempt = heapq.heappop(self._queue)
+                store = self.stores.get(fd)
+                if store is not None and self.running.get(store, 0) >= self.per_store:
+                    self._push(now + self.busy_delay, job, fd, attempt)
+                    continue
+
+                self._active += 1
+                self.running[store] = self.running.get(store, 0) + 1
+                self._pool.submit(self._execute, job, fd, attempt, store)
+
+    def _execute(self, job, fd, attempt, store):
+        next_run = None
+        try:
+            if not self.idle(fd) or not fd.lock.acquire(blocking=False):
+                next_run = (time.time() + self.busy_delay, attempt)
+                return
+            try:
+                if not fd.connected:
+                    fd.connect()
+                result = job.action(fd)
+                ok = True
+            except Exception as e:
+                result = e
+                ok = False
+            finally:
+                fd.lock.release()
+
+            self.results[(job.name, fd)] = (datetime.now(), ok, result)
+            for callback in self.callbacks:
+                callback(job, fd, ok, result)
+
+            if not ok and attempt < job.retries:
+                next_run = (time.time() + job.retry_delay * 2 ** attempt, attempt + 1)
+            else:
+                next_run = (time.time() + job.interval, 0)
+        finally:
+            with self._cond:
+                self._active -= 1
+                self.running[store] -= 1
+                if next_run is not None:
+                    self._push(next_run[0], job, fd, next_run[1])
+                self._cond.notify()
@@ -0,0 +1,125 @@
+import queue
+import threading
+
+from bon import (FiscalBon, PayMode)
+
+STOP = object()
+
+
+# Receipt printed while the basket is scanned. The receipt is opened on the first add()
+# and every sale is sent by a background thread, so only total and close are left for
+# the payment. On any error the receipt is cancelled and the error is raised by the
+# next add() or pay(); leaving the with block without paying cancels it too. A payment
+# broken by a communication error is finished by recover(), the slip may be out already.
+class ReceiptSession:
+
+    def __init__(self, fd, operator, password, work_place, n_sale=None):
+        self.fd = fd
+        self.operator = operator
+        self.password = password
+        self.work_place = work_place
+        self.n_sale = n_sale
+        self.bon = FiscalBon(operator, password, work_place, n_sale)   # the lines sent so far
+        self.last_slip = None
+        self.total = 0          # in cents
+        self.opened = False
+        self.closed = False
+        self.error = None
+        self.queue = queue.Queue()
+        self.thread = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if not self.closed:
+            self.cancel()
+
+    def check(self):
+        if self.error is not None:
+            raise self.error
+        if self.closed:
+            raise Exception('Receipt session closed')
+
+    def add(self, product):
+        self.check()
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, name='ReceiptSession', daemon=True)
+            self.thread.start()
+        self.total += int(round(product.total() * 100))
+        self.queue.put(product)
+
+    def run(self):
+        while True:
+            p = self.queue.get()
+            try:
+                if p is STOP:
+                    return
+                if self.error is not None:
+                    continue    # rolled back, drop the rest
+                if not self.opened:
+                    self.last_slip = self.fd.read_last_slip()
+                    self.fd.open_fiscal_receipt(self.operator, self.password, self.work_place, self.n_sale)
+                    self.opened = True
+                self.fd.fiscal_sale(p.name, p.tax_cd, p.price, p.quantity, p.unit)
+                self.bon.add(p)
+            except Exception as e:
+                self.error = e
+                self.rollback()
+            finally:
+                self.queue.task_done()
+
+    def rollback(self):
+        if self.opened:
+            self.opened = False
+            try:
+                self.fd.cancel_bon()
+            except Exception:
+                pass    # the device will refuse a new receipt, recover() sorts that out
+
+    def stop(self):
+        if self.thread is not None:
+            self.queue.put(STOP)
+            self.thread.join()
+            self.thread = None
+
+    def pay(self, amount=None, pay_mode=PayMode.CASH):
+        # Waits for the sales still in flight, then sends total and close. Returns the slip number.
+        self.queue.join()
+        self.stop()
+        self.check()
+        if not self.opened:
+            raise Exception('Empty receipt')
+        if amount is None:
+            amount = self.total / 100.0
+        if amount < self.total / 100.0:
+            raise Exception('Insufficient amount')
+        self.bon.pay_mode = pay_mode
+        self.bon.payed = amount
+        try:
+            self.fd.total(pay_mode, amount)
+            self.fd.close_bon()
+        except OSError as e:
+            # The answer may be lost after printing, cancelling would have the sale rung again
+            try:
+                result = self.fd.recover(self.bon, self.bon.products, self.last_slip)
+            except Exception as r:
+                self.error = r
+                raise
+            if result in ('not_printed', 'cancelled'):
+                self.error = e
+                self.opened = False
+                raise
+        except Exception as e:
+            self.error = e
+            self.rollback()
+            raise
+        self.closed = True
+        if self.fd.cash_ledger is not None and pay_mode == PayMode.CASH:
+            self.fd.cash_ledger.sale(self.total / 100.0)
+        return self.fd.last_slip
+
+    def cancel(self):
+        self.stop()
+        self.rollback()
+        self.closed = True
@@ -2,6 +2,7 @@ from bon import (FiscalBon, Product, PayMode)
 from ecr import DatecsFiscalDevice
 from protocol import DatecsProtocol
 from connector import (EthernetConnector, SerialConnector)
+from salenum import SaleNumberAllocator
 from datetime import datetime
 
 
@@ -19,7 +20,7 @@ if __name__ == '__main__':
             fd.cash_in_out(20.123)
             print('Cash availability:', fd.get_cash_availability())
 
-            n_sale = '{0:s}-{1:04d}-{2:07d}'.format(fd.serial_number, 1, 2123)
+            n_sale = SaleNumberAllocator('.', fd.serial_number, till=1).n_sale()
 
             with FiscalBon(1, 1, 1, n_sale) as bon:
                 bon.add(Product('Potatoes', 2.350, 0.85, 'kg'))
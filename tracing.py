@@ -0,0 +1,40 @@
+import itertools
+import json
+import time
+
+now = time.perf_counter_ns
+
+
+# Fixed size ring buffer of timing spans. Recording is one tuple store, nothing is formatted
+# or written until dump(). Spans: (name, start ns, duration ns, receipt, command).
+class Tracer:
+
+    def __init__(self, size=4096, dump_path=None):
+        self.size = size
+        self.dump_path = dump_path      # where to dump on a receipt error, None - don't
+        self.spans = [None] * size
+        self.counter = itertools.count()
+        self.receipts = itertools.count(1)
+        self.offset = time.time_ns() - now()
+
+    def record(self, name, start, receipt=None, cmd=None):
+        end = now()
+        self.spans[next(self.counter) % self.size] = (name, start, end - start, receipt, cmd)
+        return end
+
+    def new_receipt(self):
+        return next(self.receipts)
+
+    def snapshot(self):
+        # Spans from the oldest one
+        spans = [s for s in self.spans if s is not None]
+        return sorted(spans, key=lambda s: s[1])
+
+    def dump(self, path=None):
+        with open(path or self.dump_path, 'a') as f:
+            for name, start, duration, receipt, cmd in self.snapshot():
+                f.write(json.dumps({'name': name,
+                                    'start': (start + self.offset) / 1e9,
+                                    'ms': duration / 1e6,
+                                    'receipt': receipt,
+                                    'cmd': cmd}) + '\n')